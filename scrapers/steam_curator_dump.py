@@ -1,19 +1,87 @@
 #!/usr/bin/env python3
 import argparse
+import asyncio
+import collections
 import csv
+import gzip
+import hashlib
 import json
+import os
+import random
 import re
+import stat
+import tempfile
 import sys
+import threading
 import time
-from datetime import datetime
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from itertools import repeat
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from html import unescape
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Iterator, Optional
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+from steam_curator_text import normalize_review_candidates
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import lxml
+except ImportError:
+    lxml = None
 
 SCRIPT_DIR = Path(__file__).parent
 DATA_DIR = SCRIPT_DIR.parent / "data"
+CACHE_DIR = SCRIPT_DIR.parent / ".cache" / "steam_curator"
+
+_LOG_LOCK = threading.Lock()
+
+EXPORT_FORMATS = ("json", "ndjson", "csv", "txt", "appids")
+CSV_FIELDS = ["appid", "url", "curator_url", "review", "review_has_url", "review_url_count", "type"]
+REVIEW_KEYS = frozenset(CSV_FIELDS)
+LINK_FIELDS = frozenset(["appid", "url", "curator_url"])
+SINK_FIELDS = {"txt": frozenset(["appid", "url"]), "appids": frozenset(["appid"])}
+
+PARSERS = ("lxml", "html.parser")
+DEFAULT_PARSER = "lxml" if lxml is not None else "html.parser"
+RECOMMENDATION_STRAINER = SoupStrainer("div", class_=re.compile(r"recommend|curator"))
+APP_LINK_STRAINER = SoupStrainer("a", href=re.compile(r"/app/\d+"))
+APP_HREF_RE = re.compile(r"/app/(\d+)")
+REVIEW_TEXT_CLASSES = (
+    "recommendation_desc",
+    "recommendation_desc_text",
+    "curator_review",
+    "curator_review_desc",
+    "blurb",
+    "desc",
+)
+REVIEW_FALLBACK_TAGS = ("div", "span", "p")
+REVIEW_FALLBACK_LIMIT = 60
+START_TAG_RE = re.compile(r"<[a-zA-Z]")
+FAST_ATTRS = r'(?:[ \t\n]+(?!href=)[a-z][\w-]*="[^"<>]*")*'
+FAST_BLOCK_RE = re.compile(
+    r'<div class="recommendation(?P<kind>(?: [a-z_]+)*)">[ \t\n]*'
+    r'<div class="capsule smallcapsule"><a href="(?P<href>[^"<>]*)"' + FAST_ATTRS + r'>'
+    r'(?:<img' + FAST_ATTRS + r'[ \t\n]*/?>)?</a></div>[ \t\n]*'
+    r'<div class="recommendation_desc">(?P<desc>[^<]*'
+    r'(?:(?:<br[ \t\n]*/?>|<a href="[^"<>]*"' + FAST_ATTRS + r'>[^<]*</a>)[^<]*)*)</div>[ \t\n]*'
+    r'(?:<div class="recommendation_readmore"><a href="(?P<more>[^"<>]*)"' + FAST_ATTRS + r'>[^<]*</a></div>[ \t\n]*)?'
+    r'(?:<div class="curator_review_date">(?P<date>[^<]*)</div>[ \t\n]*)?'
+    r'</div>[ \t\n]*'
+)
+FAST_TAG_RE = re.compile(r"<[^>]*>")
+FAST_DESC_HREF_RE = re.compile(r'<a href="([^"<>]*)"')
+FAST_UNSAFE_RE = re.compile(r"&(?!(?:amp|lt|gt|quot|nbsp|#\d{1,5}|#x[0-9a-fA-F]{1,4});)|[\x00-\x08\x0b-\x1f\x7f]")
+FAST_CHARREF_RE = re.compile(r"&#(x[0-9a-fA-F]+|\d+);")
 
 QUASARPLAY_CURATORS = {
     "quasarplay": {"id": 42788178, "name": "퀘이사플레이", "output": "quasarplay.json"},
@@ -32,16 +100,12 @@ def normalize_base_url(raw: str) -> str:
         s += "/"
     return s
 
-def sanitize_review_text(text: str):
-    if not text:
-        return "", False, 0
-    url_pattern = re.compile(r'https?://[^\s"\'<>]+')
-    urls = url_pattern.findall(text)
-    cleaned = url_pattern.sub("", text)
-    cleaned = re.sub(r"링크\s*:", "", cleaned)
-    cleaned = re.sub(r"\n+", "\n", cleaned).strip()
-    cleaned = re.sub(r"[,\\s]+$", "", cleaned)
-    return cleaned, len(urls) > 0, len(urls)
+def rec_type_for_classes(cls_str: str) -> str:
+    if "not_recommended" in cls_str or "negative" in cls_str:
+        return "not_recommended"
+    if "informational" in cls_str:
+        return "informational"
+    return "recommended"
 
 def to_abs_steam_url(href: str) -> str:
     if not href:
@@ -53,59 +117,830 @@ def to_abs_steam_url(href: str) -> str:
         return ("https://store.steampowered.com" + h).split("?")[0]
     return h.split("?")[0]
 
-def is_date_like(text: str) -> bool:
-    t = (text or "").strip()
-    if not t:
-        return False
-    if len(t) > 32:
-        return False
-    months = r"(January|February|March|April|May|June|July|August|September|October|November|December)"
-    if re.match(rf"^\d{{1,2}}\s+{months}(,\s*\d{{4}})?$", t):
-        return True
-    if re.match(r"^\d{4}-\d{2}-\d{2}$", t):
-        return True
-    if re.match(r"^\d{4}\.\d{1,2}\.\d{1,2}\.?$", t):
+def _current_umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+NEW_FILE_MODE = 0o666 & ~_current_umask()
+
+def _temp_file_for(path: Path) -> tuple:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
+
+def _replace_with_temp(tmp_path: str, path: Path):
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = NEW_FILE_MODE
+    os.chmod(tmp_path, mode)
+    os.replace(tmp_path, path)
+
+def _discard_temp(tmp_path: str):
+    try:
+        os.unlink(tmp_path)
+    except OSError:
+        pass
+
+@contextmanager
+def atomic_write(output_file: str, encoding: str = "utf-8", newline: Optional[str] = None, binary: bool = False):
+    path = Path(output_file)
+    fd, tmp_path = _temp_file_for(path)
+    try:
+        with (os.fdopen(fd, "wb") if binary else os.fdopen(fd, "w", encoding=encoding, newline=newline)) as f:
+            yield f
+        _replace_with_temp(tmp_path, path)
+    except BaseException:
+        _discard_temp(tmp_path)
+        raise
+
+def create_session(pool_size: int = 10) -> requests.Session:
+    session = requests.Session()
+    if pool_size > 10:
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+    session.headers.update(SteamCuratorDumper.DEFAULT_HEADERS)
+    return session
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    v = (value or "").strip()
+    if not v:
+        return None
+    if v.isdigit():
+        return float(v)
+    try:
+        when = parsedate_to_datetime(v)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+class CuratorHTTPError(Exception):
+    def __init__(self, status: int, url: str):
+        super().__init__(f"HTTP {status}: {url}")
+        self.status = status
+        self.url = url
+
+def is_retryable_error(error: BaseException) -> bool:
+    if isinstance(error, CuratorHTTPError):
+        return error.status >= 500 or error.status == 429
+    if isinstance(error, (requests.Timeout, requests.ConnectionError, asyncio.TimeoutError, ValueError)):
         return True
-    if re.match(r"^\d{4}년\s*\d{1,2}월\s*\d{1,2}일$", t):
+    if aiohttp is not None and isinstance(error, aiohttp.ClientError):
         return True
     return False
 
+class RetryPolicy:
+    def __init__(
+        self,
+        attempts: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+        requeue_rounds: int = 1,
+    ):
+        self.attempts = max(1, int(attempts))
+        self.backoff_base = float(backoff_base)
+        self.backoff_max = float(backoff_max)
+        self.requeue_rounds = max(0, int(requeue_rounds))
+
+    def should_retry(self, attempt: int, error: BaseException) -> bool:
+        return attempt < self.attempts and is_retryable_error(error)
+
+    def delay(self, attempt: int) -> float:
+        delay = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(delay / 2, delay)
+
+class RateLimiter:
+    RETRY_STATUSES = (429, 503)
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, rate: float = 3.0, burst: int = 5, backoff_base: float = 2.0, backoff_max: float = 120.0):
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self.backoff_base = float(backoff_base)
+        self.backoff_max = float(backoff_max)
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+
+    @classmethod
+    def shared(cls) -> "RateLimiter":
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def reserve(self) -> float:
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            if now > self._updated:
+                self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+            self._tokens -= 1.0
+            wait = self._updated - now
+            if self._tokens < 0:
+                wait += -self._tokens / self.rate
+            return max(0.0, wait)
+
+    def blocked_for(self) -> float:
+        with self._lock:
+            return max(0.0, self._blocked_until - time.monotonic())
+
+    def wait(self):
+        delay = self.reserve()
+        while delay > 0:
+            time.sleep(delay)
+            delay = self.blocked_for()
+
+    def backoff(self, retry_after: Optional[float] = None) -> float:
+        if self.rate <= 0:
+            return 0.0
+        delay = min(self.backoff_max, self.backoff_base)
+        delay = random.uniform(delay / 2, delay)
+        if retry_after is not None:
+            delay = max(delay, min(self.backoff_max, retry_after) + random.uniform(0, 1))
+        with self._lock:
+            now = time.monotonic()
+            until = now + delay
+            if until > self._blocked_until:
+                self._blocked_until = until
+            if until > self._updated:
+                self._tokens = min(self._tokens, 0.0)
+                self._updated = until
+        return delay
+
+class CheckpointJournal:
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.windows = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_curator(cls, curator_id: int, sort: str, directory: Optional[Path] = None) -> "CheckpointJournal":
+        directory = Path(directory) if directory else CACHE_DIR / "checkpoints"
+        return cls(directory / f"{curator_id}_{sort}.jsonl")
+
+    def _load(self, header: dict) -> dict:
+        windows = {}
+        with open(self.path, "r", encoding="utf-8") as f:
+            first = f.readline()
+            try:
+                if json.loads(first) != header:
+                    return {}
+            except ValueError:
+                return {}
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+                windows[int(entry["start"])] = (int(entry["count"]), entry["reviews"], entry.get("page"))
+        return windows
+
+    def begin(self, header: dict, resume: bool = False) -> int:
+        with self._lock:
+            self.windows = self._load(header) if resume and self.path.exists() else {}
+            if not self.windows:
+                with atomic_write(str(self.path)) as f:
+                    f.write(json.dumps(header, ensure_ascii=False) + "\n")
+            return len(self.windows)
+
+    def get(self, start: int, count: int) -> Optional[list]:
+        entry = self.windows.get(start)
+        if entry is None or entry[0] != count:
+            return None
+        return entry[1]
+
+    def page(self, start: int) -> Optional[str]:
+        entry = self.windows.get(start)
+        return entry[2] if entry is not None else None
+
+    def record(self, start: int, count: int, reviews: list, page: Optional[str] = None):
+        entry = {"start": start, "count": count, "reviews": reviews}
+        if page:
+            entry["page"] = page
+        line = json.dumps(entry, ensure_ascii=False, default=_review_json_default) + "\n"
+        with self._lock:
+            self.windows[start] = (count, reviews, page)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+
+    def clear(self):
+        with self._lock:
+            self.windows = {}
+            try:
+                self.path.unlink()
+            except FileNotFoundError:
+                pass
+
+class BaseUrlCache:
+    DEFAULT_TTL = 7 * 24 * 3600
+
+    def __init__(self, path: Optional[Path] = None, ttl: float = DEFAULT_TTL):
+        self.path = Path(path) if path else CACHE_DIR / "base_urls.json"
+        self.ttl = float(ttl)
+        self._lock = threading.Lock()
+        self._entries = None
+
+    def _load(self) -> dict:
+        if self._entries is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                self._entries = data if isinstance(data, dict) else {}
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def _save(self):
+        with atomic_write(str(self.path)) as f:
+            json.dump(self._entries, f, ensure_ascii=False, indent=2)
+
+    def get(self, curator_id: int) -> Optional[dict]:
+        with self._lock:
+            entry = self._load().get(str(curator_id))
+        if not entry or time.time() - float(entry.get("saved_at", 0)) > self.ttl:
+            return None
+        return entry
+
+    def put(self, curator_id: int, entry: dict):
+        with self._lock:
+            self._load()[str(curator_id)] = dict(entry, saved_at=time.time())
+            self._save()
+
+    def update(self, curator_id: int, **fields):
+        with self._lock:
+            entry = self._load().get(str(curator_id))
+            if entry is None:
+                return
+            entry.update(fields)
+            self._save()
+
+    def invalidate(self, curator_id: int):
+        with self._lock:
+            if self._load().pop(str(curator_id), None) is not None:
+                self._save()
+
+class ParseCache:
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+    SOURCE_FILES = ("steam_curator_dump.py", "steam_curator_text.py")
+
+    def __init__(self, directory: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = Path(directory) if directory else CACHE_DIR / "parsed"
+        self.max_bytes = max(0, int(max_bytes))
+        self.salt = self._source_fingerprint()
+        self._lock = threading.Lock()
+        self._entries = None
+        self._size = 0
+
+    @classmethod
+    def _source_fingerprint(cls) -> str:
+        h = hashlib.sha1()
+        for name in cls.SOURCE_FILES:
+            try:
+                h.update((SCRIPT_DIR / name).read_bytes())
+            except OSError:
+                h.update(name.encode("utf-8"))
+        return h.hexdigest()
+
+    def key(self, html: str, *context) -> str:
+        h = hashlib.sha1(self.salt.encode("utf-8"))
+        h.update(json.dumps(context, default=str).encode("utf-8"))
+        h.update(html.encode("utf-8"))
+        return h.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _load(self) -> collections.OrderedDict:
+        if self._entries is None:
+            entries = []
+            for path in self.directory.glob("*.json"):
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, path.stem, st.st_size))
+            self._entries = collections.OrderedDict((key, size) for _, key, size in sorted(entries))
+            self._size = sum(self._entries.values())
+        return self._entries
+
+    def get(self, key: str) -> Optional[list]:
+        with self._lock:
+            entries = self._load()
+            if key not in entries:
+                return None
+            path = self._path(key)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    reviews = json.load(f)
+                os.utime(path)
+            except (OSError, ValueError):
+                self._size -= entries.pop(key)
+                return None
+            entries.move_to_end(key)
+            return reviews
+
+    def put(self, key: str, reviews: list):
+        data = json.dumps(reviews, ensure_ascii=False, default=_review_json_default)
+        size = len(data.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            entries = self._load()
+            try:
+                with atomic_write(str(self._path(key))) as f:
+                    f.write(data)
+            except OSError:
+                return
+            self._size += size - entries.pop(key, 0)
+            entries[key] = size
+            self._evict()
+
+    def _evict(self):
+        while self._size > self.max_bytes and self._entries:
+            key, size = self._entries.popitem(last=False)
+            self._size -= size
+            try:
+                self._path(key).unlink()
+            except FileNotFoundError:
+                pass
+
+class CassetteMissError(LookupError):
+    pass
+
+class CassetteSession:
+    MODES = ("record", "replay")
+    RECORDED_HEADERS = ("Content-Type", "Retry-After")
+
+    def __init__(
+        self,
+        directory,
+        mode: str = "replay",
+        session: Optional[requests.Session] = None,
+        latency: float = 0.0,
+    ):
+        if mode not in self.MODES:
+            raise ValueError(f"unknown cassette mode: {mode}")
+        self.directory = Path(directory)
+        self.mode = mode
+        self.latency = max(0.0, float(latency))
+        self.session = session if session is not None or mode == "replay" else create_session()
+        self.headers = dict(SteamCuratorDumper.DEFAULT_HEADERS)
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    @staticmethod
+    def request_key(url: str, params: Optional[dict] = None) -> str:
+        query = json.dumps(sorted((str(k), str(v)) for k, v in (params or {}).items()), ensure_ascii=False)
+        return hashlib.sha1(f"GET {url} {query}".encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _load(self, key: str) -> Optional[dict]:
+        with self._lock:
+            if key not in self._entries:
+                try:
+                    with open(self._path(key), "r", encoding="utf-8") as f:
+                        self._entries[key] = json.load(f)
+                except (OSError, ValueError):
+                    return None
+            return self._entries[key]
+
+    def _save(self, key: str, entry: dict):
+        with self._lock:
+            self._entries[key] = entry
+            with atomic_write(str(self._path(key))) as f:
+                json.dump(entry, f, ensure_ascii=False)
+
+    @staticmethod
+    def _to_response(entry: dict) -> requests.Response:
+        r = requests.Response()
+        r.status_code = int(entry["status"])
+        r.url = entry["url"]
+        r.headers.update(entry.get("headers") or {})
+        r.encoding = "utf-8"
+        r._content = entry["body"].encode("utf-8")
+        return r
+
+    def _record(self, key: str, url: str, params: Optional[dict], r: requests.Response) -> requests.Response:
+        headers = {h: r.headers[h] for h in self.RECORDED_HEADERS if h in r.headers}
+        self._save(
+            key,
+            {"url": url, "params": params or {}, "status": r.status_code, "headers": headers, "body": r.text},
+        )
+        return r
+
+    def _get(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        timeout=None,
+    ) -> requests.Response:
+        key = self.request_key(url, params)
+        if self.mode == "record":
+            return self._record(
+                key,
+                url,
+                params,
+                self.session.get(url, params=params, headers=headers, timeout=timeout),
+            )
+        entry = self._load(key)
+        if entry is None:
+            raise CassetteMissError(f"cassette에 없는 요청: {url}" + (f" {params}" if params else ""))
+        return self._to_response(entry)
+
+    def get(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        timeout=None,
+    ) -> requests.Response:
+        if self.latency:
+            time.sleep(self.latency)
+        return self._get(url, params=params, headers=headers, timeout=timeout)
+
+    async def aget(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        timeout=None,
+    ) -> requests.Response:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.mode == "record":
+            return await asyncio.to_thread(self._get, url, params, headers, timeout)
+        return self._get(url, params=params, headers=headers, timeout=timeout)
+
+    def close(self):
+        if self.session is not None:
+            self.session.close()
+
+class PageArchive:
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.pages_dir = self.directory / "pages"
+        self.stored = 0
+
+    @staticmethod
+    def page_key(html: str) -> str:
+        return hashlib.sha1(html.encode("utf-8")).hexdigest()
+
+    def page_path(self, key: str) -> Path:
+        return self.pages_dir / f"{key}.html.gz"
+
+    def put(self, html: str) -> str:
+        key = self.page_key(html)
+        path = self.page_path(key)
+        if not path.exists():
+            with atomic_write(str(path), binary=True) as f:
+                f.write(gzip.compress(html.encode("utf-8"), mtime=0))
+            self.stored += 1
+        return key
+
+    def read(self, key: str) -> str:
+        with gzip.open(self.page_path(key), "rb") as f:
+            return f.read().decode("utf-8")
+
+    def manifest_path(self, curator_id: int, sort: str) -> Path:
+        return self.directory / f"{curator_id}_{sort}.json"
+
+    def write_manifest(self, manifest: dict):
+        path = self.manifest_path(manifest["curator_id"], manifest["sort"])
+        with atomic_write(str(path)) as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        return path
+
+    def manifests(self) -> list:
+        return sorted(self.directory.glob("*_*.json"))
+
+    def load_manifest(self, curator_id: Optional[int] = None, sort: Optional[str] = None) -> dict:
+        if curator_id is not None and sort is not None:
+            path = self.manifest_path(curator_id, sort)
+        else:
+            candidates = [p for p in self.manifests() if curator_id is None or p.name.startswith(f"{curator_id}_")]
+            if len(candidates) != 1:
+                names = ", ".join(p.name for p in candidates) or "없음"
+                raise LookupError(f"아카이브 manifest를 하나로 정할 수 없습니다: {self.directory} ({names})")
+            path = candidates[0]
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+class ReviewRecord:
+    __slots__ = ("appid", "url", "review", "review_has_url", "review_url_count", "type", "curator_id")
+
+    def __init__(
+        self,
+        appid,
+        url: Optional[str] = None,
+        review: Optional[str] = None,
+        review_has_url: Optional[bool] = None,
+        review_url_count: Optional[int] = None,
+        type: Optional[str] = None,
+        curator_id: Optional[int] = None,
+    ):
+        self.appid = int(appid)
+        self.url = url
+        self.review = review
+        self.review_has_url = review_has_url
+        self.review_url_count = review_url_count
+        self.type = sys.intern(type) if type is not None else None
+        self.curator_id = curator_id
+
+    @classmethod
+    def from_dict(cls, data, curator_id: Optional[int] = None) -> "ReviewRecord":
+        if isinstance(data, cls):
+            return data
+        return cls(
+            data["appid"],
+            data.get("url"),
+            data.get("review"),
+            data.get("review_has_url"),
+            data.get("review_url_count"),
+            data.get("type"),
+            curator_id,
+        )
+
+    @property
+    def curator_url(self) -> Optional[str]:
+        if self.curator_id is None:
+            return None
+        return f"https://store.steampowered.com/app/{self.appid}/?curator_clanid={self.curator_id}"
+
+    def get(self, key: str, default=None):
+        if key == "appid":
+            return str(self.appid)
+        value = getattr(self, key) if key in REVIEW_KEYS else None
+        return default if value is None else value
+
+    def to_dict(self) -> dict:
+        data = {}
+        for key in CSV_FIELDS:
+            value = self.get(key)
+            if value is not None:
+                data[key] = value
+        return data
+
+    def __eq__(self, other):
+        if isinstance(other, ReviewRecord):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ReviewRecord({self.to_dict()!r})"
+
+def _review_json_default(obj):
+    if isinstance(obj, ReviewRecord):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def as_review_dict(review) -> dict:
+    return review.to_dict() if isinstance(review, ReviewRecord) else review
+
+class NoReviewsError(Exception):
+    pass
+
+class NdjsonWriter:
+    def __init__(self, output_file: str, header: dict):
+        self.path = Path(output_file)
+        self.header = header
+        self.count = 0
+        self._file = None
+        self._tmp_path = None
+
+    def _write_line(self, obj: dict):
+        self._file.write(
+            json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=_review_json_default) + "\n",
+        )
+
+    def _open(self):
+        fd, self._tmp_path = _temp_file_for(self.path)
+        self._file = os.fdopen(fd, "w", encoding="utf-8", buffering=1)
+        self._write_line({"record": "header", **self.header, "exported_at": datetime.now().isoformat()})
+
+    def __enter__(self):
+        return self
+
+    def write(self, review: dict):
+        if self._file is None:
+            self._open()
+        self._write_line(review)
+        self.count += 1
+
+    def close(self, trailer: Optional[dict] = None):
+        if self._file is None:
+            return
+        if trailer is not None:
+            self._write_line(
+                {"record": "trailer", "total_games": self.count, **trailer, "finished_at": datetime.now().isoformat()},
+            )
+        self._file.close()
+        self._file = None
+        if trailer is None:
+            _discard_temp(self._tmp_path)
+        else:
+            _replace_with_temp(self._tmp_path, self.path)
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close({} if exc_type is None else None)
+
 class SteamCuratorDumper:
     BASE_URL = "https://store.steampowered.com/curator"
+    MIN_BATCH_SIZE = 10
+    DEFAULT_HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+        "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+        "Accept": "*/*",
+    }
 
-    def __init__(self, curator_id: int, verbose: bool = True, sort: str = "recent", batch_size: int = 50, delay: float = 0.3):
+    def __init__(
+        self,
+        curator_id: int,
+        verbose: bool = True,
+        sort: str = "recent",
+        batch_size: int = 50,
+        delay: Optional[float] = None,
+        concurrency: int = 1,
+        session=None,
+        base_url: Optional[str] = None,
+        limiter: Optional[RateLimiter] = None,
+        label: Optional[str] = None,
+        checkpoint: bool = False,
+        resume: bool = False,
+        base_cache: Optional[BaseUrlCache] = None,
+        adaptive_batch: bool = False,
+        max_batch_size: int = 500,
+        retry: Optional[RetryPolicy] = None,
+        parser: Optional[str] = None,
+        parse_workers: int = 0,
+        fields=None,
+        fast_path: bool = True,
+        archive: Optional[PageArchive] = None,
+        parse_cache: Optional[ParseCache] = None,
+    ):
+        if parser is not None and parser not in PARSERS:
+            raise ValueError(f"unknown parser: {parser}")
+        if parser == "lxml" and lxml is None:
+            raise ValueError("lxml parser requires lxml (pip install lxml)")
         self.curator_id = curator_id
+        self.parser = parser or DEFAULT_PARSER
+        self.parse_workers = max(0, int(parse_workers))
+        self.fields = frozenset(fields) if fields is not None else None
+        self.fast_path = fast_path
+        self.archive = archive
+        self.parse_cache = parse_cache
+        self._archived_pages = {}
+        self._review_starts = {}
+        self._fast_path_missed = False
+        self._parse_pool = None
         self.verbose = verbose
         self.sort = sort
         self.batch_size = int(batch_size)
-        self.delay = float(delay)
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-            "Accept": "*/*",
-        })
+        self.adaptive_batch = adaptive_batch
+        self.max_batch_size = max(self.batch_size, int(max_batch_size))
+        self.concurrency = max(1, int(concurrency))
+        self.label = label
+        self.session = session if session is not None else self._new_session()
+        if limiter is None:
+            limiter = RateLimiter(rate=1.0 / delay, burst=1) if delay else RateLimiter.shared()
+        self.limiter = limiter
+        self.checkpoint = CheckpointJournal.for_curator(curator_id, sort) if checkpoint or resume else None
+        self.resume = resume
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.failed_windows = []
+        self.stats = {}
+        self._batch = self.batch_size
+        self.base_cache = base_cache
         self.curator_name = None
         self.total_count = 0
-        self._curator_page_url = f"{self.BASE_URL}/{self.curator_id}/"
+        self.base_url = (base_url or self.BASE_URL).rstrip("/")
+        self._curator_page_url = f"{self.base_url}/{self.curator_id}/"
         self._curator_base_url = None
         self._filtered_url = None
+        self._curator_html = None
+        self._curator_soup = None
+        self._curator_page_lock = threading.Lock()
+        self._base_from_cache = False
+        self._cached_info = None
+
+    def _new_session(self):
+        return create_session(self.concurrency)
 
     def log(self, message: str):
         if self.verbose:
-            print(message)
+            if self.label:
+                message = "\n".join(f"[{self.label}] {line}" if line else line for line in message.split("\n"))
+            with _LOG_LOCK:
+                print(message)
+
+    def _throttle(self, status: int, retry_after: Optional[str]):
+        if status in self.limiter.RETRY_STATUSES:
+            delay = self.limiter.backoff(parse_retry_after(retry_after))
+            self.log(f"HTTP {status}: 요청 속도를 {delay:.1f}초 늦춥니다")
+
+    def _get(self, url: str, params: Optional[dict] = None, headers: Optional[dict] = None) -> requests.Response:
+        self.limiter.wait()
+        r = self.session.get(url, params=params, headers=headers, timeout=25)
+        self._throttle(r.status_code, r.headers.get("Retry-After"))
+        return r
 
     def _prime_and_get_base(self) -> str:
         if self._curator_base_url and self._filtered_url:
             return self._curator_base_url
-        r = self.session.get(self._curator_page_url, timeout=25)
-        html = r.text or ""
-        m = re.search(r'g_strCuratorBaseURL\s*=\s*"([^"]+)"', html)
+        if self._restore_base_from_cache():
+            return self._curator_base_url
+        self._load_curator_page()
+        if self._set_base_from_curator_page():
+            self._store_base_cache()
+        return self._curator_base_url
+
+    def _cached_base_entry(self) -> Optional[dict]:
+        if not self.base_cache:
+            return None
+        entry = self.base_cache.get(self.curator_id)
+        if not entry or not entry.get("base_url") or not entry.get("filtered_url"):
+            return None
+        return entry
+
+    def _restore_base_from_cache(self) -> bool:
+        entry = self._cached_base_entry()
+        if not entry:
+            return False
+        self._curator_base_url = entry["base_url"]
+        self._filtered_url = entry["filtered_url"]
+        self._base_from_cache = True
+        if entry.get("curator_name") and not self.curator_name:
+            self.curator_name = entry["curator_name"]
+        return True
+
+    def _store_base_cache(self):
+        if not self.base_cache:
+            return
+        info = self._curator_info_from_page()
+        self.base_cache.put(self.curator_id, {
+            "base_url": self._curator_base_url,
+            "filtered_url": self._filtered_url,
+            "curator_name": info.get("curator_name"),
+            "followers": info.get("followers"),
+        })
+
+    def _invalidate_cached_base(self) -> bool:
+        with self._curator_page_lock:
+            if not self._base_from_cache:
+                return False
+            self.log("캐시된 큐레이터 주소가 유효하지 않아 다시 확인합니다.")
+            self.base_cache.invalidate(self.curator_id)
+            self._base_from_cache = False
+            self._curator_base_url = None
+            self._filtered_url = None
+            return True
+
+    def _cached_curator_info(self) -> Optional[dict]:
+        entry = self._cached_base_entry()
+        if not entry:
+            return None
+        self._restore_base_from_cache()
+        return {
+            "curator_id": self.curator_id,
+            "curator_name": entry.get("curator_name"),
+            "curator_url": self._curator_page_url,
+            "followers": entry.get("followers"),
+        }
+
+    def _load_curator_page(self) -> str:
+        with self._curator_page_lock:
+            if self._curator_html is None:
+                r = self._get(self._curator_page_url)
+                if r.status_code >= 400:
+                    raise CuratorHTTPError(r.status_code, self._curator_page_url)
+                self._curator_html = r.text or ""
+        return self._curator_html
+
+    def _curator_page_soup(self) -> BeautifulSoup:
+        if self._curator_soup is None:
+            self._curator_soup = BeautifulSoup(self._curator_html or "", "html.parser")
+        return self._curator_soup
+
+    def _set_base_from_curator_page(self) -> bool:
+        m = re.search(r'g_strCuratorBaseURL\s*=\s*"([^"]+)"', self._curator_html or "")
         base = None
         if m:
             base = normalize_base_url(m.group(1))
+        found = bool(base)
         if not base:
-            soup = BeautifulSoup(html, "html.parser")
+            soup = self._curator_page_soup()
             canon = soup.find("link", rel="canonical")
             if canon and canon.get("href"):
                 base = normalize_base_url(canon.get("href"))
@@ -117,33 +952,38 @@ class SteamCuratorDumper:
             base = normalize_base_url(self._curator_page_url)
         self._curator_base_url = base
         self._filtered_url = base + "ajaxgetfilteredrecommendations/"
-        return self._curator_base_url
+        return found
 
     def get_curator_info(self) -> dict:
-        url = self._curator_page_url
+        cached = self._cached_curator_info()
+        if cached:
+            return cached
         try:
-            r = self.session.get(url, timeout=25)
-            soup = BeautifulSoup(r.text, "html.parser")
-            name_elem = soup.find("h1", class_="curator_name") or soup.find("h1")
-            if name_elem:
-                self.curator_name = name_elem.get_text(strip=True)
-            follower_elem = soup.find(class_=re.compile(r"follower|follow_count|num_followers|followers"))
-            followers = 0
-            if follower_elem:
-                m = re.search(r"[\d,]+", follower_elem.get_text())
-                if m:
-                    digits = re.sub(r"[^0-9]", "", m.group(0))
-                    followers = int(digits) if digits else 0
-            return {
-                "curator_id": self.curator_id,
-                "curator_name": self.curator_name,
-                "curator_url": url,
-                "followers": followers,
-            }
+            self._call_with_retry(None, self._load_curator_page)
+            return self._curator_info_from_page()
         except Exception as e:
             self.log(f"큐레이터 정보 가져오기 실패: {e}")
             return {"curator_id": self.curator_id}
 
+    def _curator_info_from_page(self) -> dict:
+        soup = self._curator_page_soup()
+        name_elem = soup.find("h1", class_="curator_name") or soup.find("h1")
+        if name_elem:
+            self.curator_name = name_elem.get_text(strip=True)
+        follower_elem = soup.find(class_=re.compile(r"follower|follow_count|num_followers|followers"))
+        followers = 0
+        if follower_elem:
+            m = re.search(r"[\d,]+", follower_elem.get_text())
+            if m:
+                digits = re.sub(r"[^0-9]", "", m.group(0))
+                followers = int(digits) if digits else 0
+        return {
+            "curator_id": self.curator_id,
+            "curator_name": self.curator_name,
+            "curator_url": self._curator_page_url,
+            "followers": followers,
+        }
+
     def _filtered_params(self, start: int, count: int) -> dict:
         return {
             "query": "",
@@ -157,80 +997,779 @@ class SteamCuratorDumper:
             "reset": "false",
         }
 
-    def _fetch_filtered(self, start: int, count: int) -> dict:
-        self._prime_and_get_base()
-        headers = {
+    def _filtered_headers(self) -> dict:
+        return {
             "Referer": self._curator_page_url,
             "X-Requested-With": "XMLHttpRequest",
             "Accept": "*/*",
         }
-        r = self.session.get(self._filtered_url, params=self._filtered_params(start, count), headers=headers, timeout=25)
+
+    def _request_filtered(self, start: int, count: int) -> dict:
+        r = self._get(self._filtered_url, params=self._filtered_params(start, count), headers=self._filtered_headers())
+        if r.status_code >= 400:
+            raise CuratorHTTPError(r.status_code, self._filtered_url)
         return r.json()
 
+    def _fetch_filtered(self, start: int, count: int) -> dict:
+        self._prime_and_get_base()
+        try:
+            data = self._request_filtered(start, count)
+            if data.get("success") or not self._base_from_cache:
+                return data
+        except CuratorHTTPError as e:
+            if not self._base_from_cache or e.status != 404:
+                raise
+        except ValueError:
+            if not self._base_from_cache:
+                raise
+        self._invalidate_cached_base()
+        self._prime_and_get_base()
+        return self._request_filtered(start, count)
+
+    def _set_total_from_data(self, data: dict) -> int:
+        total = int(data.get("total_count", 0) or 0)
+        self.total_count = total
+        return total
+
     def get_total_count(self) -> int:
         try:
-            data = self._fetch_filtered(0, 1)
-            total = int(data.get("total_count", 0) or 0)
-            self.total_count = total
-            return total
+            return self._set_total_from_data(self._fetch_filtered(0, 1))
         except Exception as e:
             self.log(f"전체 리뷰 수 확인 실패: {e}")
             return 0
 
+    def _observe_total(self, data: dict):
+        total = int(data.get("total_count", 0) or 0)
+        if not total or total == self.total_count:
+            return
+        if self.total_count:
+            self.log(f"전체 리뷰 수 변경: {self.total_count} -> {total}")
+        self.total_count = total
+
+    def _first_window_count(self) -> int:
+        if not self.adaptive_batch:
+            return self.batch_size
+        entry = self._cached_base_entry()
+        if entry and entry.get("batch_size"):
+            return max(self.batch_size, min(self.max_batch_size, int(entry["batch_size"])))
+        return self.max_batch_size
+
+    def _can_shrink_first_window(self, count: int) -> bool:
+        return self.adaptive_batch and count > self.batch_size
+
+    def _shrink_first_window(self, count: int, reason: str) -> int:
+        smaller = max(self.batch_size, count // 2)
+        self.log(f"배치 크기 {count} 요청 실패 ({reason}), {smaller}(으)로 다시 시도합니다.")
+        return smaller
+
+    def _start_window_stats(self, count: int):
+        self._batch = count
+        self.stats = {
+            "batch_size": count,
+            "requested_batch_size": count,
+            "windows": 0,
+            "truncated_windows": 0,
+            "collected": 0,
+            "retries": 0,
+            "failed_windows": [],
+            "parse_cache_hits": 0,
+            "parsed_pages": 0,
+            "fast_path_pages": 0,
+        }
+
+    def _fetch_first_window(self) -> Optional[list]:
+        count = self._first_window_count()
+        while True:
+            try:
+                data = self._call_with_retry(0, self._fetch_filtered, 0, count)
+            except Exception as e:
+                if not self._can_shrink_first_window(count):
+                    raise
+                count = self._shrink_first_window(count, str(e))
+                continue
+            if not data.get("success") and self._can_shrink_first_window(count):
+                count = self._shrink_first_window(count, "success=false")
+                continue
+            break
+        self._start_window_stats(count)
+        self.total_count = int(data.get("total_count", 0) or 0)
+        return self._reviews_from_data(0, data)
+
+    def _fetch_window(self, start: int, count: int) -> Optional[list]:
+        restored = self._restored_window(start, count)
+        if restored is not None:
+            return restored
+        reviews = self._reviews_from_data(start, self._fetch_filtered(start, count))
+        self._record_window(start, count, reviews)
+        return reviews
+
+    def _is_truncated(self, start: int, count: int, reviews: list) -> bool:
+        return 0 < len(reviews) < count and start + len(reviews) < self.total_count
+
+    def _set_batch(self, size: int, reason: str):
+        size = max(self.MIN_BATCH_SIZE, size)
+        if size >= self._batch:
+            return
+        self.log(f"배치 크기 조정: {self._batch} -> {size} ({reason})")
+        self._batch = size
+        self.stats["batch_size"] = size
+
+    def _next_window_start(self, start: int, count: int, reviews: list) -> int:
+        if self._is_truncated(start, count, reviews):
+            self.stats["truncated_windows"] += 1
+            if self.adaptive_batch:
+                self._set_batch(len(reviews), f"start={start} 에서 {count}개 중 {len(reviews)}개만 반환")
+            elif self.stats["truncated_windows"] == 1:
+                self.log(f"start={start} 에서 {count}개 중 {len(reviews)}개만 반환되어 나머지를 이어서 요청합니다 (--adaptive-batch 권장)")
+            return start + len(reviews)
+        return start + count
+
+    def _shrink_batch_on_error(self):
+        if self.adaptive_batch:
+            self._set_batch(self._batch // 2, "요청 오류")
+
+    def _store_batch_size(self):
+        if self.adaptive_batch and self.base_cache and self._cached_base_entry():
+            self.base_cache.update(self.curator_id, batch_size=self._batch)
+
+    def _begin_checkpoint(self, total: int):
+        self.failed_windows = []
+        if not self.checkpoint:
+            return
+        header = {"curator_id": self.curator_id, "sort": self.sort, "batch_size": self.batch_size, "total": total}
+        if self.fields is not None:
+            header["fields"] = sorted(self.fields)
+        restored = self.checkpoint.begin(header, resume=self.resume)
+        if restored:
+            self.log(f"체크포인트에서 {restored}개 구간 복원: {self.checkpoint.path}")
+
+    def _restored_window(self, start: int, count: int) -> Optional[list]:
+        if not self.checkpoint:
+            return None
+        reviews = self.checkpoint.get(start, count)
+        if reviews is None:
+            return None
+        if self.archive is not None and self.checkpoint.page(start):
+            self._archived_pages[start] = self.checkpoint.page(start)
+        return [ReviewRecord.from_dict(r, self.curator_id) for r in reviews]
+
+    def _record_window(self, start: int, count: int, reviews: Optional[list]):
+        if self.checkpoint and reviews is not None:
+            self.checkpoint.record(start, count, reviews, self._archived_pages.get(start))
+
+    def _window_failed(self, start: int, count: int, error: Exception):
+        self.log(f"오류 발생 (start={start}): {error}")
+        self.failed_windows.append(
+            {
+                "start": start,
+                "count": count,
+                "error": f"{type(error).__name__}: {error}",
+                "retryable": is_retryable_error(error),
+            },
+        )
+        self._shrink_batch_on_error()
+
+    def _log_retry(self, start: Optional[int], attempt: int, error: Exception) -> float:
+        self.stats["retries"] = self.stats.get("retries", 0) + 1
+        delay = self.retry.delay(attempt)
+        where = f" (start={start})" if start is not None else ""
+        self.log(f"재시도 {attempt}/{self.retry.attempts - 1}{where}: {type(error).__name__}: {error} - {delay:.1f}초 후")
+        return delay
+
+    def _call_with_retry(self, start: Optional[int], fn, *args):
+        attempt = 1
+        while True:
+            try:
+                return fn(*args)
+            except Exception as e:
+                if not self.retry.should_retry(attempt, e):
+                    raise
+                time.sleep(self._log_retry(start, attempt, e))
+                attempt += 1
+
+    def _take_failed_windows(self) -> collections.deque:
+        queue = collections.deque((w["start"], w["count"]) for w in self.failed_windows if w["retryable"])
+        self.failed_windows = [w for w in self.failed_windows if not w["retryable"]]
+        if queue:
+            self.log(f"실패한 구간 {len(queue)}개를 다시 요청합니다...")
+        return queue
+
+    def _requeue_window_done(self, queue: collections.deque, start: int, count: int, reviews: Optional[list]) -> bool:
+        if not reviews:
+            return False
+        self.stats["collected"] += len(reviews)
+        gap_start = self._next_window_start(start, count, reviews)
+        if gap_start < start + count:
+            queue.append((gap_start, start + count - gap_start))
+        return True
+
+    def _retry_failed_windows(self) -> Iterator[tuple]:
+        for _ in range(self.retry.requeue_rounds):
+            queue = self._take_failed_windows()
+            if not queue:
+                return
+            while queue:
+                start, count = queue.popleft()
+                try:
+                    reviews = self._call_with_retry(start, self._fetch_window, start, count)
+                except Exception as e:
+                    self._window_failed(start, count, e)
+                    continue
+                if self._requeue_window_done(queue, start, count, reviews):
+                    yield start, reviews
+
+    def _report_failed_windows(self):
+        self.stats["failed_windows"] = list(self.failed_windows)
+        if not self.failed_windows:
+            return
+        self.log(f"\n가져오지 못한 구간 {len(self.failed_windows)}개:")
+        for w in self.failed_windows:
+            self.log(f"  start={w['start']} count={w['count']} ({w['error']})")
+
+    def _finish_checkpoint(self):
+        if not self.checkpoint:
+            return
+        if self.failed_windows:
+            self.log(f"실패한 구간 {len(self.failed_windows)}개: --resume 으로 다시 실행하면 누락 구간만 가져옵니다 ({self.checkpoint.path})")
+        else:
+            self.checkpoint.clear()
+
+    def _results_html_from_data(self, start: int, data: dict) -> Optional[str]:
+        if not data.get("success"):
+            self.log(f"API 요청 실패: start={start}")
+            return None
+        self._observe_total(data)
+        html = data.get("results_html", "") or None
+        if html is not None and self.archive is not None:
+            self._archived_pages[start] = self.archive.put(html)
+        return html
+
+    def _write_archive_manifest(self):
+        if self.archive is None:
+            return
+        path = self.archive.write_manifest({
+            "curator_id": self.curator_id,
+            "curator_name": self.curator_name,
+            "curator_url": self._curator_page_url,
+            "sort": self.sort,
+            "total_count": self.total_count,
+            "complete": not self.failed_windows,
+            "archived_at": datetime.now().isoformat(),
+            "pages": [{"start": start, "sha1": key} for start, key in sorted(self._archived_pages.items())],
+        })
+        self.log(f"페이지 아카이브: {len(self._archived_pages)}개 페이지 (새로 저장 {self.archive.stored}개), {path}")
+
+    def _parse_cache_key(self, html: str) -> Optional[str]:
+        if self.parse_cache is None:
+            return None
+        fields = sorted(self.fields) if self.fields is not None else None
+        return self.parse_cache.key(html, self.curator_id, self.parser, fields)
+
+    def _cached_reviews(self, key: Optional[str]) -> Optional[list]:
+        if key is None:
+            return None
+        cached = self.parse_cache.get(key)
+        if cached is None:
+            return None
+        self.stats["parse_cache_hits"] = self.stats.get("parse_cache_hits", 0) + 1
+        return [ReviewRecord.from_dict(r, self.curator_id if "curator_url" in r else None) for r in cached]
+
+    def _store_parsed(self, key: Optional[str], reviews: list):
+        if key is not None:
+            self.parse_cache.put(key, reviews)
+
+    def _store_parsed_future(self, key: Optional[str], future: Future):
+        if not future.cancelled() and future.exception() is None:
+            self._store_parsed(key, future.result()[0])
+
+    def _reviews_from_data(self, start: int, data: dict) -> Optional[list]:
+        html = self._results_html_from_data(start, data)
+        if html is None:
+            return None
+        key = self._parse_cache_key(html)
+        reviews = self._cached_reviews(key)
+        if reviews is None:
+            reviews = self._parse_reviews_html(html)
+            self._store_parsed(key, reviews)
+        return reviews
+
+    @contextmanager
+    def _parsing_pool(self):
+        if self.parse_workers <= 0:
+            yield None
+            return
+        self._parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers)
+        self.log(f"파싱 프로세스 수: {self.parse_workers}")
+        try:
+            yield self._parse_pool
+        finally:
+            self._parse_pool.shutdown(wait=True, cancel_futures=True)
+            self._parse_pool = None
+
+    def _max_in_flight(self) -> int:
+        return 2 * (self.concurrency + self.parse_workers)
+
+    def _fetch_window_stage(self, start: int, count: int):
+        if self._parse_pool is None:
+            return self._fetch_window(start, count)
+        restored = self._restored_window(start, count)
+        if restored is not None:
+            return restored
+        html = self._results_html_from_data(start, self._fetch_filtered(start, count))
+        if html is None:
+            return None
+        key = self._parse_cache_key(html)
+        reviews = self._cached_reviews(key)
+        if reviews is not None:
+            self._record_window(start, count, reviews)
+            return reviews
+        future = self._parse_pool.submit(
+            parse_results_html,
+            html,
+            self.curator_id,
+            self.parser,
+            type(self),
+            self.fields,
+            self.fast_path,
+        )
+        if key is not None:
+            future.add_done_callback(lambda f: self._store_parsed_future(key, f))
+        return future
+
+    def _resolve_window(self, start: int, count: int, result) -> Optional[list]:
+        if not isinstance(result, Future):
+            return result
+        reviews = self._parsed_result(result.result())
+        self._record_window(start, count, reviews)
+        return reviews
+
+    def _fetch_serial(self, start: int, progress_callback=None) -> Iterator[tuple]:
+        while start < self.total_count:
+            count = self._batch
+            try:
+                reviews = self._call_with_retry(start, self._fetch_window, start, count)
+            except Exception as e:
+                self._window_failed(start, count, e)
+                start += count
+                continue
+            if not self._accept_window(start, count, reviews, progress_callback):
+                break
+            yield start, reviews
+            start = self._next_window_start(start, count, reviews)
+
+    def _fetch_concurrent(self, next_start: int, progress_callback=None) -> Iterator[tuple]:
+        pending = collections.deque()
+        pool = ThreadPoolExecutor(max_workers=self.concurrency)
+        max_in_flight = self._max_in_flight()
+        try:
+            while True:
+                while next_start < self.total_count and len(pending) < max_in_flight:
+                    count = self._batch
+                    pending.append(
+                        (
+                            next_start,
+                            count,
+                            False,
+                            pool.submit(self._call_with_retry, next_start, self._fetch_window_stage, next_start, count),
+                        ),
+                    )
+                    next_start += count
+                if not pending:
+                    break
+                start, count, is_gap, future = pending.popleft()
+                try:
+                    reviews = self._resolve_window(start, count, future.result())
+                except Exception as e:
+                    self._window_failed(start, count, e)
+                    continue
+                if is_gap and reviews == []:
+                    continue
+                if not self._accept_window(start, count, reviews, progress_callback):
+                    break
+                yield start, reviews
+                gap_start = self._next_window_start(start, count, reviews)
+                if gap_start < start + count:
+                    gap_count = start + count - gap_start
+                    pending.appendleft(
+                        (
+                            gap_start,
+                            gap_count,
+                            True,
+                            pool.submit(
+                                self._call_with_retry,
+                                gap_start,
+                                self._fetch_window_stage,
+                                gap_start,
+                                gap_count,
+                            ),
+                        ),
+                    )
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _accept_window(self, start: int, count: int, reviews: Optional[list], progress_callback=None) -> bool:
+        if reviews is None:
+            return False
+        self.stats["windows"] += 1
+        self.stats["collected"] += len(reviews)
+        total = self.total_count
+        progress = min(start + count, total)
+        self.log(f"진행: {progress}/{total} ({self.stats['collected']} 게임 수집됨)")
+        if progress_callback:
+            progress_callback(progress, total)
+        return bool(reviews)
+
+    def _begin_fetch(self, first: Optional[list]) -> bool:
+        if self.total_count == 0:
+            self.log("리뷰를 찾을 수 없습니다.")
+            return False
+        self.log(f"총 {self.total_count}개의 리뷰를 가져옵니다...")
+        self._begin_checkpoint(self.total_count)
+        self._record_window(0, self._batch, first)
+        if self.concurrency > 1:
+            self.log(f"동시 요청 수: {self.concurrency}")
+        return True
+
+    def _flatten_pages(self, pages: dict) -> list:
+        return [review for start in sorted(pages) for review in pages[start]]
+
+    def _unique_reviews(self, reviews: list, seen: set) -> Iterator[dict]:
+        for review in reviews:
+            appid = review.get("appid")
+            if appid and appid not in seen:
+                seen.add(appid)
+                yield review
+
+    def _finish_fetch(self, unique_count: int):
+        self._report_failed_windows()
+        self._write_archive_manifest()
+        self._finish_checkpoint()
+        self._store_batch_size()
+        if self.parse_cache is not None and self.stats.get("parse_cache_hits"):
+            self.log(f"\n파싱 캐시 적중: {self.stats['parse_cache_hits']}/{self.stats['windows']}개 페이지")
+        self._log_parse_stats()
+        if self.adaptive_batch:
+            self.log(
+                f"\n배치 크기: {self.stats['batch_size']} "
+                f"(요청 {self.stats['windows']}회, 잘린 페이지 {self.stats['truncated_windows']}개)"
+            )
+        self.log(f"\n완료! {unique_count}개의 고유 게임 수집됨")
+
+    def _fetch_pages(self, progress_callback=None) -> Iterator[tuple]:
+        try:
+            first = self._fetch_first_window()
+        except Exception as e:
+            self.log(f"전체 리뷰 수 확인 실패: {e}")
+            self.total_count = 0
+            first = None
+        if not self._begin_fetch(first):
+            return
+        first_count = self._batch
+        if not self._accept_window(0, first_count, first, progress_callback):
+            return
+        yield 0, first
+        next_start = self._next_window_start(0, first_count, first)
+        with self._parsing_pool() as parse_pool:
+            if self.concurrency > 1 or parse_pool is not None:
+                yield from self._fetch_concurrent(next_start, progress_callback)
+            else:
+                yield from self._fetch_serial(next_start, progress_callback)
+        yield from self._retry_failed_windows()
+
+    def _page_reviews(self, start: int, reviews: list, seen: set) -> Iterator[dict]:
+        for review in self._unique_reviews(reviews, seen):
+            self._review_starts[review.get("appid")] = start
+            yield review
+
+    def _in_offset_order(self, reviews: list) -> list:
+        return sorted(reviews, key=lambda review: self._review_starts.get(review.get("appid"), 0))
+
+    def iter_reviews(self, progress_callback=None) -> Iterator[dict]:
+        seen = set()
+        self._review_starts = {}
+        for start, reviews in self._fetch_pages(progress_callback):
+            yield from self._page_reviews(start, reviews, seen)
+        if self.total_count:
+            self._finish_fetch(len(seen))
+
     def fetch_reviews(self, progress_callback=None) -> list:
-        all_reviews = []
-        start = 0
-        total = self.get_total_count()
-        if total == 0:
+        return self._in_offset_order(list(self.iter_reviews(progress_callback)))
+
+    def _parse_archived_pages(self, archive: PageArchive, keys: list, workers: int) -> Iterator[list]:
+        if workers <= 1:
+            for key in keys:
+                yield self._parse_reviews_html(archive.read(key))
+            return
+        self.log(f"파싱 프로세스 수: {workers}")
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunksize = max(1, len(keys) // (workers * 4))
+            results = pool.map(
+                parse_archived_page,
+                repeat(str(archive.directory)),
+                keys,
+                repeat(self.curator_id),
+                repeat(self.parser),
+                repeat(type(self)),
+                repeat(self.fields),
+                repeat(self.fast_path),
+                chunksize=chunksize,
+            )
+            for result in results:
+                yield self._parsed_result(result)
+
+    def iter_archived_reviews(self, archive: PageArchive, manifest: dict, workers: int = 0) -> Iterator[dict]:
+        self.curator_name = manifest.get("curator_name")
+        self._curator_page_url = manifest.get("curator_url") or self._curator_page_url
+        self.total_count = int(manifest.get("total_count") or 0)
+        keys = [page["sha1"] for page in sorted(manifest.get("pages") or [], key=lambda page: page["start"])]
+        if not manifest.get("complete", True):
+            self.log("경고: 일부 구간을 가져오지 못한 실행의 아카이브입니다")
+        self.log(f"아카이브에서 {len(keys)}개 페이지를 다시 파싱합니다...")
+        seen = set()
+        for reviews in self._parse_archived_pages(archive, keys, workers):
+            yield from self._unique_reviews(reviews, seen)
+        self._log_parse_stats()
+        self.log(f"\n완료! {len(seen)}개의 고유 게임 수집됨")
+
+    def _can_fetch_incremental(self, previous: list) -> bool:
+        if not previous:
+            self.log("증분 모드: 이전 결과가 없어 전체 덤프를 진행합니다.")
+            return False
+        if self.sort != "recent":
+            self.log(f"증분 모드: sort={self.sort} 에서는 지원되지 않아 전체 덤프를 진행합니다.")
+            return False
+        return True
+
+    def _review_signature(self, review) -> tuple:
+        return review.get("review"), review.get("type")
+
+    def _is_known_window(self, reviews: list, known: dict) -> bool:
+        return all(known.get(r.get("appid")) == self._review_signature(r) for r in reviews)
+
+    def _merge_incremental(self, fresh: dict, previous: list, known: dict) -> Optional[list]:
+        self._store_batch_size()
+        fresh = self._remove_duplicates(self._flatten_pages(fresh))
+        changed = sum(1 for r in fresh if known.get(r.get("appid")) != self._review_signature(r))
+        merged = self._remove_duplicates(fresh + previous)
+        if self.total_count and len(merged) != self.total_count:
+            self.log(f"\n증분 결과 {len(merged)}개가 전체 리뷰 수 {self.total_count}개와 다릅니다 (삭제된 리뷰 등). 전체 덤프를 진행합니다.")
+            return None
+        self._log_parse_stats()
+        self.log(f"\n증분 완료! 신규/변경 {changed}개, 전체 {len(merged)}개 게임")
+        return merged
+
+    def _begin_incremental(self, previous: list) -> Optional[dict]:
+        if self.total_count == 0:
             self.log("리뷰를 찾을 수 없습니다.")
+            return None
+        self.log(f"증분 모드: 이전 결과 {len(previous)}개, 전체 {self.total_count}개 중 새 항목을 찾습니다...")
+        return {r.get("appid"): self._review_signature(r) for r in previous}
+
+    def _next_incremental_start(
+        self,
+        fresh: dict,
+        start: int,
+        count: int,
+        reviews: Optional[list],
+        known: dict,
+        progress_callback=None,
+    ) -> Optional[int]:
+        if not self._accept_window(start, count, reviews, progress_callback):
+            return None
+        fresh[start] = reviews
+        if self._is_known_window(reviews, known):
+            return None
+        next_start = self._next_window_start(start, count, reviews)
+        return next_start if next_start < self.total_count else None
+
+    def _abort_incremental(self, start: int, error: Exception):
+        self.log(f"오류 발생 (start={start}): {error}")
+        self.log("증분 모드를 중단하고 전체 덤프를 진행합니다.")
+
+    def fetch_incremental(self, previous: list, progress_callback=None) -> list:
+        if not self._can_fetch_incremental(previous):
+            return self.fetch_reviews(progress_callback)
+        try:
+            reviews = self._fetch_first_window()
+        except Exception as e:
+            self._abort_incremental(0, e)
+            return self.fetch_reviews(progress_callback)
+        known = self._begin_incremental(previous)
+        if known is None:
             return []
-        self.log(f"총 {total}개의 리뷰를 가져옵니다...")
-        while start < total:
+        fresh = {}
+        start, count = 0, self._batch
+        while True:
+            start = self._next_incremental_start(fresh, start, count, reviews, known, progress_callback)
+            if start is None:
+                break
+            count = self._batch
             try:
-                data = self._fetch_filtered(start, self.batch_size)
-                if not data.get("success"):
-                    self.log(f"API 요청 실패: start={start}")
-                    break
-                html = data.get("results_html", "")
-                if not html:
-                    break
-                reviews = self._parse_reviews_html(html)
-                all_reviews.extend(reviews)
-                fetched = len(reviews)
-                start += self.batch_size
-                progress = min(start, total)
-                self.log(f"진행: {progress}/{total} ({len(all_reviews)} 게임 수집됨)")
-                if progress_callback:
-                    progress_callback(progress, total)
-                if fetched <= 0:
-                    break
-                time.sleep(self.delay)
+                reviews = self._reviews_from_data(
+                    start,
+                    self._call_with_retry(start, self._fetch_filtered, start, count),
+                )
             except Exception as e:
-                self.log(f"오류 발생 (start={start}): {e}")
-                start += self.batch_size
+                self._abort_incremental(start, e)
+                return self.fetch_reviews(progress_callback)
+        merged = self._merge_incremental(fresh, previous, known)
+        return merged if merged is not None else self.fetch_reviews(progress_callback)
+
+    def _parse_links_soup(self, soup: BeautifulSoup) -> list:
+        results = []
+        seen = set()
+        for link in soup.find_all("a", href=APP_HREF_RE):
+            href = link.get("href", "")
+            m = APP_HREF_RE.search(href)
+            if not m or m.group(1) in seen:
                 continue
-        unique = self._remove_duplicates(all_reviews)
-        self.log(f"\n완료! {len(unique)}개의 고유 게임 수집됨")
-        return unique
+            appid = m.group(1)
+            url = self._app_url(appid, href) if "url" in self.fields else None
+            curator_id = self.curator_id if "curator_url" in self.fields else None
+            results.append(ReviewRecord(appid, url, curator_id=curator_id))
+            seen.add(appid)
+        return results
 
-    def _pick_best_review_text(self, container) -> str:
+    def _app_url(self, appid: str, href: str) -> str:
+        return to_abs_steam_url(href) or f"https://store.steampowered.com/app/{appid}"
+
+    def _fast_charrefs_ok(self, html: str) -> bool:
+        for m in FAST_CHARREF_RE.finditer(html):
+            ref = m.group(1)
+            code = int(ref[1:], 16) if ref[0] == "x" else int(ref)
+            if (
+                code < 0x20 and code not in (0x09, 0x0a)
+                or 0x7f <= code < 0xa0
+                or 0xd800 <= code < 0xe000
+                or 0xfdd0 <= code < 0xfdf0
+                or code & 0xfffe == 0xfffe
+            ):
+                return False
+        return True
+
+    def _fast_text(self, raw: Optional[str]) -> str:
+        if not raw:
+            return ""
+        return "\n".join(t for t in (unescape(part).strip() for part in FAST_TAG_RE.split(raw)) if t)
+
+    def _parse_reviews_fast(self, html: str) -> Optional[list]:
+        if FAST_UNSAFE_RE.search(html) or not self._fast_charrefs_ok(html):
+            return None
+        links_only = self.fields is not None and self.fields <= LINK_FIELDS
+        entries = []
+        seen = set()
         candidates = []
-        selectors = [
-            r"recommendation_desc",
-            r"recommendation_desc_text",
-            r"curator_review",
-            r"curator_review_desc",
-            r"blurb",
-            r"desc",
-        ]
-        for pat in selectors:
-            elem = container.find(class_=re.compile(pat)) if getattr(container, "find", None) else None
-            if elem:
+        rec_types = []
+        pos = len(html) - len(html.lstrip(" \t\n"))
+        while pos < len(html):
+            m = FAST_BLOCK_RE.match(html, pos)
+            if not m:
+                return None
+            pos = m.end()
+            href = unescape(m.group("href"))
+            am = APP_HREF_RE.search(href)
+            if not am:
+                return None
+            appid = am.group(1)
+            if m.group("more") is not None:
+                mm = APP_HREF_RE.search(unescape(m.group("more")))
+                if mm and mm.group(1) != appid and mm.group(1) not in seen:
+                    return None
+            if any(APP_HREF_RE.search(unescape(link)) for link in FAST_DESC_HREF_RE.findall(m.group("desc"))):
+                return None
+            if appid in seen:
+                continue
+            seen.add(appid)
+            if links_only:
+                entries.append((appid, href, None))
+                continue
+            desc = self._fast_text(m.group("desc"))
+            date = self._fast_text(m.group("date"))
+            block_candidates = [t for t in (desc, date, desc) if t]
+            if not block_candidates:
+                return None
+            entries.append((appid, href, len(candidates)))
+            candidates.append(block_candidates)
+            rec_types.append(rec_type_for_classes("recommendation" + m.group("kind")))
+        if links_only:
+            url_needed = "url" in self.fields
+            curator_id = self.curator_id if "curator_url" in self.fields else None
+            return [
+                ReviewRecord(appid, self._app_url(appid, href) if url_needed else None, curator_id=curator_id)
+                for appid, href, _ in entries
+            ]
+        texts = normalize_review_candidates(candidates)
+        return [self._review_record(appid, href, *texts[index], rec_types[index]) for appid, href, index in entries]
+
+    def _parse_page(self, html: str) -> tuple:
+        if self.fast_path:
+            results = self._parse_reviews_fast(html)
+            if results is not None:
+                return results, True
+        if self.fields is not None and self.fields <= LINK_FIELDS:
+            return self._parse_links_soup(BeautifulSoup(html, self.parser, parse_only=APP_LINK_STRAINER)), False
+        soup = BeautifulSoup(html, self.parser, parse_only=RECOMMENDATION_STRAINER)
+        if len(soup.find_all(True)) != len(START_TAG_RE.findall(html)):
+            soup = BeautifulSoup(html, self.parser)
+        return self._parse_reviews_soup(soup), False
+
+    def _parsed_result(self, result: tuple) -> list:
+        reviews, fast = result
+        self.stats["parsed_pages"] = self.stats.get("parsed_pages", 0) + 1
+        if fast:
+            self.stats["fast_path_pages"] = self.stats.get("fast_path_pages", 0) + 1
+        elif self.fast_path and not self._fast_path_missed:
+            self._fast_path_missed = True
+            self.log("   빠른 파서: 알 수 없는 리뷰 HTML 구조, BeautifulSoup으로 파싱합니다")
+        return reviews
+
+    def _parse_reviews_html(self, html: str) -> list:
+        return self._parsed_result(self._parse_page(html))
+
+    def _log_parse_stats(self):
+        if self.fast_path and self.stats.get("parsed_pages"):
+            self.log(f"\n빠른 파서 적용: {self.stats.get('fast_path_pages', 0)}/{self.stats['parsed_pages']}개 페이지")
+
+    def _recommendation_container(self, link: Tag) -> Tag:
+        container = link
+        for _ in range(14):
+            parent = container.parent
+            if parent is None:
+                break
+            if parent.name == "div":
+                cls = parent.get("class", [])
+                cls_str = " ".join(cls) if isinstance(cls, list) else str(cls)
+                if ("recommend" in cls_str) or ("curator" in cls_str):
+                    return parent
+            container = parent
+        return container
+
+    def _block_review_candidates(self, container: Tag) -> list:
+        matches = {}
+        fallback = []
+        for elem in container.descendants:
+            if not isinstance(elem, Tag):
+                continue
+            if len(matches) < len(REVIEW_TEXT_CLASSES):
+                cls = elem.get("class")
+                if cls:
+                    cls_str = " ".join(cls) if isinstance(cls, list) else str(cls)
+                    for pat in REVIEW_TEXT_CLASSES:
+                        if pat not in matches and pat in cls_str:
+                            matches[pat] = elem
+            if len(fallback) < REVIEW_FALLBACK_LIMIT and elem.name in REVIEW_FALLBACK_TAGS:
+                fallback.append(elem)
+            elif len(matches) == len(REVIEW_TEXT_CLASSES) and len(fallback) >= REVIEW_FALLBACK_LIMIT:
+                break
+        candidates = []
+        for pat in REVIEW_TEXT_CLASSES:
+            elem = matches.get(pat)
+            if elem is not None:
                 txt = elem.get_text("\n", strip=True)
                 if txt:
                     candidates.append(txt)
         if not candidates:
-            for elem in container.find_all(["div", "span", "p"], limit=60):
+            for elem in fallback:
                 cls = elem.get("class", [])
                 cls_str = " ".join(cls) if isinstance(cls, list) else str(cls)
                 if any(k in cls_str for k in ["date", "posted", "time", "timestamp"]):
@@ -238,77 +1777,54 @@ class SteamCuratorDumper:
                 txt = elem.get_text("\n", strip=True)
                 if txt and len(txt) >= 8:
                     candidates.append(txt)
-        best = ""
-        for txt in candidates:
-            if is_date_like(txt):
-                continue
-            if len(txt) > len(best):
-                best = txt
-        return best
+        return candidates
 
-    def _parse_reviews_html(self, html: str) -> list:
-        soup = BeautifulSoup(html, "html.parser")
-        results = []
-        seen = set()
+    def _block_rec_type(self, container: Tag) -> str:
+        cls_acc = []
+        cur = container
+        for _ in range(10):
+            if cur is None:
+                break
+            c = cur.get("class", [])
+            if isinstance(c, list):
+                cls_acc.extend(c)
+            cur = cur.parent
+        return rec_type_for_classes(" ".join(cls_acc))
+
+    def _review_record(
+        self,
+        appid: str,
+        href: str,
+        review: str,
+        has_url: bool,
+        url_count: int,
+        rec_type: str,
+    ) -> ReviewRecord:
+        url = to_abs_steam_url(href) or f"https://store.steampowered.com/app/{appid}"
+        return ReviewRecord(appid, url, review, has_url, url_count, rec_type, self.curator_id)
 
-        app_links = soup.find_all("a", href=re.compile(r"/app/\d+"))
-        for link in app_links:
+    def _parse_reviews_soup(self, soup: BeautifulSoup) -> list:
+        entries = []
+        seen = set()
+        blocks = {}
+        candidates = []
+        rec_types = []
+        for link in soup.find_all("a", href=APP_HREF_RE):
             href = link.get("href", "")
-            m = re.search(r"/app/(\d+)", href)
-            if not m:
+            m = APP_HREF_RE.search(href)
+            if not m or m.group(1) in seen:
                 continue
             appid = m.group(1)
-            if appid in seen:
-                continue
-
-            container = link
-            for _ in range(14):
-                parent = getattr(container, "parent", None)
-                if not parent:
-                    break
-                if getattr(parent, "name", None) == "div":
-                    cls = parent.get("class", [])
-                    cls_str = " ".join(cls) if isinstance(cls, list) else str(cls)
-                    if ("recommend" in cls_str) or ("curator" in cls_str):
-                        container = parent
-                        break
-                container = parent
-
-            raw_review = self._pick_best_review_text(container) if container else ""
-            clean_review, has_url, url_count = sanitize_review_text(raw_review)
-
-            cls_acc = []
-            cur = container
-            for _ in range(10):
-                if not cur:
-                    break
-                c = cur.get("class", [])
-                if isinstance(c, list):
-                    cls_acc.extend(c)
-                cur = getattr(cur, "parent", None)
-            cls_str = " ".join(cls_acc)
-            if "not_recommended" in cls_str or "negative" in cls_str:
-                rec_type = "not_recommended"
-            elif "informational" in cls_str:
-                rec_type = "informational"
-            else:
-                rec_type = "recommended"
-
-            url = to_abs_steam_url(href) or f"https://store.steampowered.com/app/{appid}"
-            curator_url = f"https://store.steampowered.com/app/{appid}/?curator_clanid={self.curator_id}"
-
-            results.append({
-                "appid": appid,
-                "url": url,
-                "curator_url": curator_url,
-                "review": clean_review,
-                "review_has_url": has_url,
-                "review_url_count": url_count,
-                "type": rec_type,
-            })
+            container = self._recommendation_container(link)
+            index = blocks.get(id(container))
+            if index is None:
+                index = blocks[id(container)] = len(candidates)
+                candidates.append(self._block_review_candidates(container))
+                rec_types.append(self._block_rec_type(container))
+            entries.append((appid, href, index))
             seen.add(appid)
-
-        return results
+        texts = normalize_review_candidates(candidates)
+        return [self._review_record(appid, href, *texts[index], rec_types[index]) for appid, href, index in entries]
 
     def _remove_duplicates(self, reviews: list) -> list:
         seen = set()
@@ -329,35 +1845,414 @@ class SteamCuratorDumper:
             "exported_at": datetime.now().isoformat(),
             "games": reviews,
         }
-        Path(output_file).parent.mkdir(parents=True, exist_ok=True)
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        with atomic_write(output_file) as f:
+            json.dump(data, f, ensure_ascii=False, indent=2, default=_review_json_default)
         self.log(f"JSON 파일 저장됨: {output_file}")
 
+    def ndjson_writer(self, output_file: str) -> NdjsonWriter:
+        return NdjsonWriter(output_file, {
+            "curator_id": self.curator_id,
+            "curator_name": self.curator_name or f"Curator #{self.curator_id}",
+            "curator_url": self._curator_page_url,
+            "sort": self.sort,
+        })
+
+    @contextmanager
+    def _open_sink(self, fmt: str, output_file: str):
+        if fmt == "json":
+            buffered = []
+            yield buffered.append
+            self.export_json(self._in_offset_order(buffered), output_file)
+        elif fmt == "ndjson":
+            with self.ndjson_writer(output_file) as writer:
+                yield writer.write
+            self.log(f"NDJSON 파일 저장됨: {output_file} ({writer.count}개 게임)")
+        elif fmt == "csv":
+            with atomic_write(output_file, encoding="utf-8-sig", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+                writer.writeheader()
+                yield lambda review: writer.writerow(as_review_dict(review))
+            self.log(f"CSV 파일 저장됨: {output_file}")
+        elif fmt == "txt":
+            with atomic_write(output_file) as f:
+                yield lambda review: f.write(f"{review.get('url', '')}\n")
+            self.log(f"TXT 파일 저장됨: {output_file}")
+        elif fmt == "appids":
+            with atomic_write(output_file) as f:
+                yield lambda review: f.write(f"{review.get('appid', '')}\n")
+            self.log(f"AppID 파일 저장됨: {output_file}")
+        else:
+            raise ValueError(f"unknown export format: {fmt}")
+
+    def open_sinks(self, stack: ExitStack, sinks: list) -> list:
+        return [stack.enter_context(self._open_sink(fmt, output_file)) for fmt, output_file in sinks]
+
+    def _check_complete_export(self, count: int):
+        if not count:
+            raise NoReviewsError()
+        if self.failed_windows:
+            self.log(f"가져오지 못한 구간이 {len(self.failed_windows)}개 있어 기존 출력 파일을 유지합니다.")
+            raise NoReviewsError()
+
+    def export(self, reviews, sinks: list) -> int:
+        count = 0
+        try:
+            with ExitStack() as stack:
+                writers = self.open_sinks(stack, sinks)
+                for review in reviews:
+                    for write in writers:
+                        write(review)
+                    count += 1
+                self._check_complete_export(count)
+        except NoReviewsError:
+            return 0
+        return count
+
+    def export_ndjson(self, reviews, output_file: str) -> int:
+        return self.export(reviews, [("ndjson", output_file)])
+
     def export_csv(self, reviews: list, output_file: str):
-        Path(output_file).parent.mkdir(parents=True, exist_ok=True)
-        with open(output_file, "w", encoding="utf-8-sig", newline="") as f:
-            writer = csv.DictWriter(
-                f,
-                fieldnames=["appid", "url", "curator_url", "review", "review_has_url", "review_url_count", "type"],
-            )
-            writer.writeheader()
-            writer.writerows(reviews)
-        self.log(f"CSV 파일 저장됨: {output_file}")
+        self.export(reviews, [("csv", output_file)])
 
     def export_txt(self, reviews: list, output_file: str):
-        Path(output_file).parent.mkdir(parents=True, exist_ok=True)
-        with open(output_file, "w", encoding="utf-8") as f:
-            for review in reviews:
-                f.write(f"{review.get('url', '')}\n")
-        self.log(f"TXT 파일 저장됨: {output_file}")
+        self.export(reviews, [("txt", output_file)])
 
     def export_appids(self, reviews: list, output_file: str):
-        Path(output_file).parent.mkdir(parents=True, exist_ok=True)
-        with open(output_file, "w", encoding="utf-8") as f:
-            for review in reviews:
-                f.write(f"{review.get('appid', '')}\n")
-        self.log(f"AppID 파일 저장됨: {output_file}")
+        self.export(reviews, [("appids", output_file)])
+
+class AsyncSteamCuratorDumper(SteamCuratorDumper):
+    def __init__(self, curator_id: int, session=None, **kwargs):
+        if aiohttp is None:
+            raise RuntimeError("AsyncSteamCuratorDumper 사용에는 aiohttp가 필요합니다 (pip install aiohttp)")
+        super().__init__(curator_id, session=session, **kwargs)
+        self._owns_session = session is None
+
+    def _new_session(self):
+        return None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    async def aclose(self):
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def _ensure_session(self):
+        if self.session is None:
+            connector = aiohttp.TCPConnector(limit=max(10, self.concurrency))
+            self.session = aiohttp.ClientSession(headers=self.DEFAULT_HEADERS, connector=connector)
+        return self.session
+
+    async def _limiter_wait(self):
+        delay = self.limiter.reserve()
+        while delay > 0:
+            await asyncio.sleep(delay)
+            delay = self.limiter.blocked_for()
+
+    async def _get_text(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        raise_for_status: bool = False,
+    ) -> str:
+        await self._limiter_wait()
+        status, retry_after, text = await self._transport_get(url, params, headers, aiohttp.ClientTimeout(total=25))
+        self._throttle(status, retry_after)
+        if raise_for_status and status >= 400:
+            raise CuratorHTTPError(status, url)
+        return text
+
+    async def _transport_get(self, url: str, params: Optional[dict], headers: Optional[dict], timeout) -> tuple:
+        session = self._ensure_session()
+        if isinstance(session, CassetteSession):
+            r = await session.aget(url, params=params, headers=headers, timeout=25)
+            return r.status_code, r.headers.get("Retry-After"), r.text
+        async with session.get(url, params=params, headers=headers, timeout=timeout) as r:
+            return r.status, r.headers.get("Retry-After"), await r.text()
+
+    async def _prime_and_get_base(self) -> str:
+        if self._curator_base_url and self._filtered_url:
+            return self._curator_base_url
+        if self._restore_base_from_cache():
+            return self._curator_base_url
+        await self._load_curator_page()
+        if self._set_base_from_curator_page():
+            self._store_base_cache()
+        return self._curator_base_url
+
+    async def _load_curator_page(self) -> str:
+        if self._curator_html is None:
+            self._curator_html = await self._get_text(self._curator_page_url, raise_for_status=True) or ""
+        return self._curator_html
+
+    async def get_curator_info(self) -> dict:
+        cached = self._cached_curator_info()
+        if cached:
+            return cached
+        try:
+            await self._call_with_retry(None, self._load_curator_page)
+            return self._curator_info_from_page()
+        except Exception as e:
+            self.log(f"큐레이터 정보 가져오기 실패: {e}")
+            return {"curator_id": self.curator_id}
+
+    async def _request_filtered(self, start: int, count: int) -> dict:
+        text = await self._get_text(
+            self._filtered_url,
+            params=self._filtered_params(start, count),
+            headers=self._filtered_headers(),
+            raise_for_status=True,
+        )
+        return json.loads(text)
+
+    async def _fetch_filtered(self, start: int, count: int) -> dict:
+        await self._prime_and_get_base()
+        try:
+            data = await self._request_filtered(start, count)
+            if data.get("success") or not self._base_from_cache:
+                return data
+        except CuratorHTTPError as e:
+            if not self._base_from_cache or e.status != 404:
+                raise
+        except ValueError:
+            if not self._base_from_cache:
+                raise
+        self._invalidate_cached_base()
+        await self._prime_and_get_base()
+        return await self._request_filtered(start, count)
+
+    async def get_total_count(self) -> int:
+        try:
+            return self._set_total_from_data(await self._fetch_filtered(0, 1))
+        except Exception as e:
+            self.log(f"전체 리뷰 수 확인 실패: {e}")
+            return 0
+
+    async def _call_with_retry(self, start: Optional[int], fn, *args):
+        attempt = 1
+        while True:
+            try:
+                return await fn(*args)
+            except Exception as e:
+                if not self.retry.should_retry(attempt, e):
+                    raise
+                await asyncio.sleep(self._log_retry(start, attempt, e))
+                attempt += 1
+
+    async def _retry_failed_windows(self) -> AsyncIterator[tuple]:
+        for _ in range(self.retry.requeue_rounds):
+            queue = self._take_failed_windows()
+            if not queue:
+                return
+            while queue:
+                start, count = queue.popleft()
+                try:
+                    reviews = await self._call_with_retry(start, self._fetch_window, start, count)
+                except Exception as e:
+                    self._window_failed(start, count, e)
+                    continue
+                if self._requeue_window_done(queue, start, count, reviews):
+                    yield start, reviews
+
+    async def _fetch_first_window(self) -> Optional[list]:
+        count = self._first_window_count()
+        while True:
+            try:
+                data = await self._call_with_retry(0, self._fetch_filtered, 0, count)
+            except Exception as e:
+                if not self._can_shrink_first_window(count):
+                    raise
+                count = self._shrink_first_window(count, str(e))
+                continue
+            if not data.get("success") and self._can_shrink_first_window(count):
+                count = self._shrink_first_window(count, "success=false")
+                continue
+            break
+        self._start_window_stats(count)
+        self.total_count = int(data.get("total_count", 0) or 0)
+        return self._reviews_from_data(0, data)
+
+    async def _fetch_window(self, start: int, count: int) -> Optional[list]:
+        restored = self._restored_window(start, count)
+        if restored is not None:
+            return restored
+        data = await self._fetch_filtered(start, count)
+        if self._parse_pool is None:
+            reviews = self._reviews_from_data(start, data)
+        else:
+            html = self._results_html_from_data(start, data)
+            key = None if html is None else self._parse_cache_key(html)
+            reviews = self._cached_reviews(key)
+            if html is not None and reviews is None:
+                loop = asyncio.get_running_loop()
+                reviews = self._parsed_result(
+                    await loop.run_in_executor(
+                        self._parse_pool,
+                        parse_results_html,
+                        html,
+                        self.curator_id,
+                        self.parser,
+                        type(self),
+                        self.fields,
+                        self.fast_path,
+                    ),
+                )
+                self._store_parsed(key, reviews)
+        self._record_window(start, count, reviews)
+        return reviews
+
+    async def _fetch_windows(self, next_start: int, progress_callback=None) -> AsyncIterator[tuple]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        pending = collections.deque()
+        tasks = []
+
+        def schedule(start: int, count: int, is_gap: bool, left: bool = False):
+            async def bounded():
+                async with semaphore:
+                    return await self._call_with_retry(start, self._fetch_window, start, count)
+
+            task = asyncio.ensure_future(bounded())
+            tasks.append(task)
+            if left:
+                pending.appendleft((start, count, is_gap, task))
+            else:
+                pending.append((start, count, is_gap, task))
+
+        max_in_flight = self._max_in_flight()
+        try:
+            while True:
+                while next_start < self.total_count and len(pending) < max_in_flight:
+                    count = self._batch
+                    schedule(next_start, count, False)
+                    next_start += count
+                if not pending:
+                    break
+                start, count, is_gap, task = pending.popleft()
+                try:
+                    reviews = await task
+                except Exception as e:
+                    self._window_failed(start, count, e)
+                    continue
+                if is_gap and reviews == []:
+                    continue
+                if not self._accept_window(start, count, reviews, progress_callback):
+                    break
+                yield start, reviews
+                gap_start = self._next_window_start(start, count, reviews)
+                if gap_start < start + count:
+                    schedule(gap_start, start + count - gap_start, True, left=True)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _fetch_pages(self, progress_callback=None) -> AsyncIterator[tuple]:
+        try:
+            first = await self._fetch_first_window()
+        except Exception as e:
+            self.log(f"전체 리뷰 수 확인 실패: {e}")
+            self.total_count = 0
+            first = None
+        if not self._begin_fetch(first):
+            return
+        first_count = self._batch
+        if not self._accept_window(0, first_count, first, progress_callback):
+            return
+        yield 0, first
+        with self._parsing_pool():
+            async for page in self._fetch_windows(self._next_window_start(0, first_count, first), progress_callback):
+                yield page
+        async for page in self._retry_failed_windows():
+            yield page
+
+    async def iter_reviews(self, progress_callback=None) -> AsyncIterator[dict]:
+        seen = set()
+        self._review_starts = {}
+        async for start, reviews in self._fetch_pages(progress_callback):
+            for review in self._page_reviews(start, reviews, seen):
+                yield review
+        if self.total_count:
+            self._finish_fetch(len(seen))
+
+    async def fetch_reviews(self, progress_callback=None) -> list:
+        return self._in_offset_order([review async for review in self.iter_reviews(progress_callback)])
+
+    async def fetch_incremental(self, previous: list, progress_callback=None) -> list:
+        if not self._can_fetch_incremental(previous):
+            return await self.fetch_reviews(progress_callback)
+        try:
+            reviews = await self._fetch_first_window()
+        except Exception as e:
+            self._abort_incremental(0, e)
+            return await self.fetch_reviews(progress_callback)
+        known = self._begin_incremental(previous)
+        if known is None:
+            return []
+        fresh = {}
+        start, count = 0, self._batch
+        while True:
+            start = self._next_incremental_start(fresh, start, count, reviews, known, progress_callback)
+            if start is None:
+                break
+            count = self._batch
+            try:
+                reviews = self._reviews_from_data(
+                    start,
+                    await self._call_with_retry(start, self._fetch_filtered, start, count),
+                )
+            except Exception as e:
+                self._abort_incremental(start, e)
+                return await self.fetch_reviews(progress_callback)
+        merged = self._merge_incremental(fresh, previous, known)
+        return merged if merged is not None else await self.fetch_reviews(progress_callback)
+
+_PARSE_WORKER_DUMPERS = {}
+
+def parse_results_html(
+    html: str,
+    curator_id: int,
+    parser: str = DEFAULT_PARSER,
+    dumper_cls: type = None,
+    fields=None,
+    fast_path: bool = True,
+) -> tuple:
+    dumper_cls = dumper_cls or SteamCuratorDumper
+    key = (dumper_cls, curator_id, parser, fields, fast_path)
+    dumper = _PARSE_WORKER_DUMPERS.get(key)
+    if dumper is None:
+        dumper = _PARSE_WORKER_DUMPERS[key] = dumper_cls(
+            curator_id,
+            verbose=False,
+            parser=parser,
+            fields=fields,
+            fast_path=fast_path,
+        )
+    return dumper._parse_page(html)
+
+def parse_archived_page(
+    directory: str,
+    key: str,
+    curator_id: int,
+    parser: str = DEFAULT_PARSER,
+    dumper_cls: type = None,
+    fields=None,
+    fast_path: bool = True,
+) -> tuple:
+    return parse_results_html(PageArchive(directory).read(key), curator_id, parser, dumper_cls, fields, fast_path)
+
+def load_previous_reviews(output_file: str) -> list:
+    try:
+        with open(output_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return []
+    games = data.get("games") if isinstance(data, dict) else None
+    return games if isinstance(games, list) else []
 
 def extract_curator_id(input_str: str) -> Optional[int]:
     m = re.search(r"curator/(\d+)", input_str)
@@ -367,41 +2262,417 @@ def extract_curator_id(input_str: str) -> Optional[int]:
         return int(input_str)
     return None
 
-def run_quasarplay_dump(sort: str):
+def iter_cassette_results(directory) -> Iterator[tuple]:
+    for path in sorted(Path(directory).glob("*.json")):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            if "ajaxgetfilteredrecommendations" not in entry.get("url", "") or int(entry.get("status", 0)) != 200:
+                continue
+            html = json.loads(entry["body"]).get("results_html") or ""
+        except (OSError, ValueError, KeyError, AttributeError):
+            continue
+        curator_id = extract_curator_id(entry["url"]) or 0
+        yield path, curator_id, html
+
+def iter_fixture_pages(directory) -> Iterator[tuple]:
+    for path in sorted(Path(directory).glob("*.html")):
+        try:
+            html = path.read_text(encoding="utf-8")
+            with open(path.with_name(f"{path.stem}.expected.json"), "r", encoding="utf-8") as f:
+                expected = json.load(f)
+            yield path, int(expected["curator_id"]), html, expected["reviews"]
+        except (OSError, ValueError, KeyError, TypeError):
+            continue
+
+def iter_corpus_pages(directory) -> Iterator[tuple]:
+    yield from iter_fixture_pages(directory)
+    for path, curator_id, html in iter_cassette_results(directory):
+        yield path, curator_id, html, None
+
+def available_parsers() -> list:
+    return [p for p in PARSERS if p != "lxml" or lxml is not None]
+
+def verify_parsers(directory) -> bool:
+    link_fields = SINK_FIELDS["txt"]
+    modes = [
+        (parser, fast_path, fields)
+        for parser in available_parsers()
+        for fast_path in (True, False)
+        for fields in (None, link_fields)
+    ]
+    dumpers = {}
+    pages = reviews = fast_pages = 0
+    mismatched = []
+    for path, curator_id, html, expected in iter_corpus_pages(directory):
+        if expected is None:
+            baseline = SteamCuratorDumper(curator_id, verbose=False, parser="html.parser", fast_path=False)
+            expected = [as_review_dict(r) for r in baseline._parse_reviews_html(html)]
+        pages += 1
+        reviews += len(expected)
+        for parser, fast_path, fields in modes:
+            key = (curator_id, parser, fast_path, fields)
+            if key not in dumpers:
+                dumpers[key] = SteamCuratorDumper(
+                    curator_id,
+                    verbose=False,
+                    parser=parser,
+                    fast_path=fast_path,
+                    fields=fields,
+                )
+            want = expected if fields is None else [{k: r[k] for k in ("appid", "url") if k in r} for r in expected]
+            actual = [as_review_dict(r) for r in dumpers[key]._parse_reviews_html(html)]
+            if actual != want:
+                mismatched.append(path.name)
+                print(
+                    f"불일치: {path.name} ({parser}, 빠른 파서 {'켬' if fast_path else '끔'}, "
+                    f"필드 {'링크' if fields else '전체'}: 기대 {len(want)}개, 결과 {len(actual)}개)"
+                )
+        if dumpers[(curator_id, DEFAULT_PARSER, True, None)]._parse_reviews_fast(html) is not None:
+            fast_pages += 1
+    print(
+        f"파서 검증: {pages}개 페이지, {reviews}개 리뷰, "
+        f"파서 {'/'.join(available_parsers())} x 빠른 파서 켬/끔 x 전체/링크 필드, 불일치 {len(mismatched)}건"
+    )
+    print(f"빠른 파서 적용: {fast_pages}/{pages}개 페이지")
+    return pages > 0 and not mismatched
+
+async def _dump_async(dumper: "AsyncSteamCuratorDumper", on_info=None, previous: Optional[list] = None) -> list:
+    async with dumper:
+        info = await dumper.get_curator_info()
+        if on_info:
+            on_info(info)
+        if previous is not None:
+            return await dumper.fetch_incremental(previous)
+        return await dumper.fetch_reviews()
+
+async def _export_async(dumper: "AsyncSteamCuratorDumper", sinks: list, on_info=None) -> int:
+    count = 0
+    async with dumper:
+        info = await dumper.get_curator_info()
+        if on_info:
+            on_info(info)
+        try:
+            with ExitStack() as stack:
+                writers = dumper.open_sinks(stack, sinks)
+                async for review in dumper.iter_reviews():
+                    for write in writers:
+                        write(review)
+                    count += 1
+                dumper._check_complete_export(count)
+        except NoReviewsError:
+            return 0
+    return count
+
+def sink_fields(sinks: list) -> Optional[frozenset]:
+    fields = frozenset()
+    for fmt, _ in sinks:
+        if fmt not in SINK_FIELDS:
+            return None
+        fields |= SINK_FIELDS[fmt]
+    return fields
+
+def default_output_file(curator_id: int, fmt: str, multiple: bool = False) -> str:
+    if fmt == "appids" and multiple:
+        return f"curator_{curator_id}_appids.txt"
+    ext = "txt" if fmt in ["txt", "appids"] else fmt
+    return f"curator_{curator_id}_reviews.{ext}"
+
+def parse_sinks(spec: str, curator_id: int, output: Optional[str] = None) -> list:
+    sinks = []
+    items = [item.strip() for item in (spec or "").split(",") if item.strip()]
+    if output and len(items) != 1:
+        raise ValueError("-o 옵션은 출력 형식이 하나일 때만 사용할 수 있습니다. 여러 개라면 형식:경로 로 지정하세요.")
+    for item in items:
+        fmt, _, path = item.partition(":")
+        fmt = fmt.strip().lower()
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"지원하지 않는 출력 형식: {fmt} (지원: {', '.join(EXPORT_FORMATS)})")
+        sinks.append((fmt, path.strip() or output or default_output_file(curator_id, fmt, len(items) > 1)))
+    if not sinks:
+        raise ValueError("출력 형식이 필요합니다.")
+    paths = [path for _, path in sinks]
+    if len(set(paths)) != len(paths):
+        raise ValueError(f"출력 파일이 겹칩니다: {', '.join(paths)}")
+    return sinks
+
+def run_reparse(
+    archive: PageArchive,
+    manifest: dict,
+    sinks: list,
+    verbose: bool = True,
+    workers: int = 0,
+    **dumper_options,
+) -> int:
+    dumper = SteamCuratorDumper(
+        manifest["curator_id"],
+        verbose=verbose,
+        sort=manifest.get("sort", "recent"),
+        fields=sink_fields(sinks),
+        **dumper_options,
+    )
+    t = time.time()
+    total = dumper.export(dumper.iter_archived_reviews(archive, manifest, workers), sinks)
+    dumper.log(f"재파싱 시간: {time.time() - t:.2f}초")
+    return total
+
+def _save_quasarplay_result(dumper: SteamCuratorDumper, config: dict, reviews: list) -> bool:
+    if not reviews:
+        dumper.log(f"경고: {config['name']} 리뷰를 가져오지 못했습니다.")
+        return False
+    output_path = DATA_DIR / config["output"]
+    if dumper.failed_windows:
+        dumper.log(f"경고: {config['name']} 가져오지 못한 구간이 {len(dumper.failed_windows)}개 있어 {output_path} 파일을 유지합니다.")
+        return False
+    dumper.export_json(reviews, str(output_path))
+    dumper.log(f"저장됨: {output_path} ({len(reviews)}개 게임)")
+    return True
+
+def _log_quasarplay_start(dumper: SteamCuratorDumper, config: dict):
+    dumper.log("덤프 시작...")
+    dumper.log(f"큐레이터 ID: {config['id']}")
+
+def _log_quasarplay_followers(dumper: SteamCuratorDumper, info: dict):
+    if info.get("followers") is not None:
+        dumper.log(f"팔로워: {info.get('followers', 0):,}명")
+
+def _previous_quasarplay_reviews(config: dict, incremental: bool) -> Optional[list]:
+    if not incremental:
+        return None
+    return load_previous_reviews(str(DATA_DIR / config["output"]))
+
+def _dump_quasarplay_curator(config: dict, session, dumper_options: dict, incremental: bool) -> bool:
+    dumper = SteamCuratorDumper(config["id"], verbose=True, session=session, label=config["name"], **dumper_options)
+    _log_quasarplay_start(dumper, config)
+    _log_quasarplay_followers(dumper, dumper.get_curator_info())
+    previous = _previous_quasarplay_reviews(config, incremental)
+    reviews = dumper.fetch_incremental(previous) if previous is not None else dumper.fetch_reviews()
+    return _save_quasarplay_result(dumper, config, reviews)
+
+async def _dump_quasarplay_curator_async(config: dict, session, dumper_options: dict, incremental: bool) -> bool:
+    dumper = AsyncSteamCuratorDumper(
+        config["id"],
+        verbose=True,
+        session=session,
+        label=config["name"],
+        **dumper_options,
+    )
+    _log_quasarplay_start(dumper, config)
+    previous = _previous_quasarplay_reviews(config, incremental)
+    reviews = await _dump_async(dumper, lambda info: _log_quasarplay_followers(dumper, info), previous)
+    return _save_quasarplay_result(dumper, config, reviews)
+
+async def _run_quasarplay_dump_async(configs: list, dumper_options: dict, incremental: bool, session=None) -> list:
+    if session is None:
+        connector = aiohttp.TCPConnector(limit=max(10, dumper_options.get("concurrency", 1) * len(configs)))
+        async with aiohttp.ClientSession(headers=SteamCuratorDumper.DEFAULT_HEADERS, connector=connector) as session:
+            return await _run_quasarplay_dump_async(configs, dumper_options, incremental, session)
+    return await asyncio.gather(
+        *(_dump_quasarplay_curator_async(config, session, dumper_options, incremental) for config in configs),
+        return_exceptions=True,
+    )
+
+def _run_quasarplay_dump_threaded(configs: list, dumper_options: dict, incremental: bool, session=None) -> list:
+    if session is None:
+        session = create_session(dumper_options.get("concurrency", 1) * len(configs))
+    outcomes = []
+    with ThreadPoolExecutor(max_workers=len(configs)) as pool:
+        futures = [
+            pool.submit(_dump_quasarplay_curator, config, session, dumper_options, incremental)
+            for config in configs
+        ]
+        for future in futures:
+            try:
+                outcomes.append(future.result())
+            except Exception as e:
+                outcomes.append(e)
+    return outcomes
+
+def run_quasarplay_dump(
+    sort: str,
+    use_async: bool = False,
+    incremental: bool = False,
+    session=None,
+    **dumper_options,
+) -> bool:
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     print("=" * 60)
     print("퀘이사플레이 큐레이터 덤프")
     print("=" * 60)
-    for _, config in QUASARPLAY_CURATORS.items():
-        print(f"\n[{config['name']}] 덤프 시작...")
-        print(f"  큐레이터 ID: {config['id']}")
-        dumper = SteamCuratorDumper(config["id"], verbose=True, sort=sort)
-        info = dumper.get_curator_info()
-        if info.get("followers") is not None:
-            print(f"  팔로워: {info.get('followers', 0):,}명")
-        reviews = dumper.fetch_reviews()
-        if reviews:
-            output_path = DATA_DIR / config["output"]
-            dumper.export_json(reviews, str(output_path))
-            print(f"  저장됨: {output_path} ({len(reviews)}개 게임)")
-        else:
-            print(f"  경고: {config['name']} 리뷰를 가져오지 못했습니다.")
+    configs = list(QUASARPLAY_CURATORS.values())
+    dumper_options["sort"] = sort
+    dumper_options.setdefault("limiter", RateLimiter.shared())
+    if use_async:
+        outcomes = asyncio.run(_run_quasarplay_dump_async(configs, dumper_options, incremental, session))
+    else:
+        outcomes = _run_quasarplay_dump_threaded(configs, dumper_options, incremental, session)
+    failed = []
+    for config, outcome in zip(configs, outcomes):
+        if isinstance(outcome, BaseException):
+            print(f"[{config['name']}] 오류 발생: {outcome}")
+            failed.append(config["name"])
+        elif not outcome:
+            failed.append(config["name"])
     print("\n" + "=" * 60)
-    print("퀘이사플레이 큐레이터 덤프 완료!")
+    if failed:
+        print(f"퀘이사플레이 큐레이터 덤프 완료 (실패: {', '.join(failed)})")
+    else:
+        print("퀘이사플레이 큐레이터 덤프 완료!")
     print("=" * 60)
+    return not failed
 
 def main():
     parser = argparse.ArgumentParser(description="Steam 큐레이터 리뷰 덤프 도구")
     parser.add_argument("curator", nargs="?", help="큐레이터 ID 또는 URL")
     parser.add_argument("-o", "--output", help="출력 파일명")
-    parser.add_argument("-f", "--format", choices=["json", "csv", "txt", "appids"], default="json", help="출력 형식")
+    parser.add_argument(
+        "-f",
+        "--format",
+        default="json",
+        help=f"출력 형식, 쉼표로 여러 개 지정 가능 ({', '.join(EXPORT_FORMATS)}). "
+        "형식:경로 로 파일 지정 (예: json,csv 또는 json:a.json,appids:ids.txt)",
+    )
     parser.add_argument("-q", "--quiet", action="store_true", help="진행 상황 출력 안함")
     parser.add_argument("--sort", default="recent", help="정렬 (recent 등)")
     parser.add_argument("--quasarplay", action="store_true", help="퀘이사플레이/퀘이사존 둘 다 덤프")
+    parser.add_argument("--concurrency", type=int, default=1, help="동시 페이지 요청 수 (기본: 1, 순차)")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="asyncio(aiohttp) 엔진 사용")
+    parser.add_argument("--rate", type=float, default=3.0, help="초당 평균 요청 수 (기본: 3.0)")
+    parser.add_argument("--burst", type=int, default=5, help="순간 허용 요청 수 (기본: 5)")
+    parser.add_argument("--resume", action="store_true", help="체크포인트에서 이전에 받은 구간을 건너뛰고 이어서 덤프")
+    parser.add_argument("--no-checkpoint", action="store_true", help="페이지별 체크포인트 기록 안함")
+    parser.add_argument("--batch-size", type=int, default=50, help="요청당 리뷰 수 (기본: 50)")
+    parser.add_argument("--adaptive-batch", action="store_true", help="엔드포인트가 허용하는 최대 배치 크기를 탐색해서 사용")
+    parser.add_argument("--max-batch-size", type=int, default=500, help="--adaptive-batch 탐색 상한 (기본: 500)")
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=3,
+        help="구간별 최대 시도 횟수, 429/503 포함 (기본: 3). 끝까지 실패한 구간은 실행 마지막에 한 번 더 같은 횟수로 시도",
+    )
+    parser.add_argument("--no-base-cache", action="store_true", help="큐레이터 주소 캐시 사용 안함")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="이전 JSON 결과를 기준으로 새로 추가/변경된 항목만 가져와 병합 (sort=recent)",
+    )
+    cassette = parser.add_mutually_exclusive_group()
+    cassette.add_argument("--record", metavar="DIR", help="요청/응답을 cassette 디렉터리에 기록")
+    cassette.add_argument("--replay", metavar="DIR", help="Steam 대신 cassette 디렉터리의 응답을 재생 (오프라인)")
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="--record/--replay 시 요청마다 추가할 지연 시간(초). --replay 는 --rate 제한 없이 이 지연만 적용",
+    )
+    parser.add_argument(
+        "--parser",
+        dest="html_parser",
+        choices=PARSERS,
+        default=DEFAULT_PARSER,
+        help=f"리뷰 HTML 파서 (기본: {DEFAULT_PARSER})",
+    )
+    parser.add_argument("--parse-workers", type=int, default=0, help="리뷰 HTML을 파싱할 프로세스 수 (기본: 0, 요청 스레드에서 파싱)")
+    parser.add_argument("--no-fast-path", action="store_true", help="정규식 빠른 파서를 끄고 항상 BeautifulSoup으로 파싱")
+    parser.add_argument(
+        "--verify-parsers",
+        metavar="DIR",
+        help="fixture(*.html + *.expected.json) 또는 cassette 디렉터리의 페이지로 모든 파서 조합의 결과를 검증하고 종료 "
+        "(예: scrapers/fixtures/steam_curator)",
+    )
+    parser.add_argument("--no-parse-cache", action="store_true", help="페이지 내용 해시 기준 파싱 결과 캐시 사용 안함")
+    parser.add_argument(
+        "--parse-cache-size",
+        type=float,
+        default=ParseCache.DEFAULT_MAX_BYTES / (1024 * 1024),
+        help="파싱 결과 캐시 최대 크기(MB), 초과 시 오래 안 쓴 항목부터 삭제 "
+        f"(기본: {ParseCache.DEFAULT_MAX_BYTES // (1024 * 1024)})",
+    )
+    parser.add_argument("--archive", metavar="DIR", help="받은 results_html 페이지를 DIR에 압축 저장 (내용 해시 기준, --reparse 용)")
+    parser.add_argument("--reparse", metavar="DIR", help="네트워크 없이 --archive 디렉터리의 페이지를 다시 파싱해서 출력 파일 생성")
+    parser.add_argument("--steam-url", help="큐레이터 페이지 기본 주소 (예: 로컬 테스트 서버 http://127.0.0.1:8765/curator)")
     args = parser.parse_args()
 
+    if args.use_async and aiohttp is None:
+        parser.error("--async 옵션에는 aiohttp가 필요합니다 (pip install aiohttp)")
+    if args.html_parser == "lxml" and lxml is None:
+        parser.error("--parser lxml 옵션에는 lxml이 필요합니다 (pip install lxml)")
+    if args.verify_parsers:
+        sys.exit(0 if verify_parsers(args.verify_parsers) else 1)
+    if args.reparse and (args.quasarplay or args.incremental or args.archive or args.record or args.replay):
+        parser.error("--reparse 옵션은 --quasarplay, --incremental, --archive, --record, --replay 와 함께 사용할 수 없습니다.")
+    if args.archive and args.incremental:
+        parser.error("--archive 옵션은 --incremental 과 함께 사용할 수 없습니다.")
+    if args.reparse:
+        archive = PageArchive(args.reparse)
+        curator_id = extract_curator_id(args.curator) if args.curator else None
+        if args.curator and not curator_id:
+            print(f"오류: 유효하지 않은 큐레이터 ID 또는 URL: {args.curator}")
+            sys.exit(1)
+        try:
+            manifest = archive.load_manifest(curator_id, args.sort if curator_id else None)
+        except (OSError, ValueError, LookupError) as e:
+            print(f"오류: {e}")
+            sys.exit(1)
+        try:
+            sinks = parse_sinks(args.format, manifest["curator_id"], args.output)
+        except ValueError as e:
+            parser.error(str(e))
+        workers = args.parse_workers or os.cpu_count() or 1
+        total = run_reparse(
+            archive,
+            manifest,
+            sinks,
+            verbose=not args.quiet,
+            workers=workers,
+            parser=args.html_parser,
+            fast_path=not args.no_fast_path,
+        )
+        if not total:
+            print("아카이브에서 리뷰를 찾지 못했습니다.")
+            sys.exit(1)
+        return
+    dumper_options = {
+        "concurrency": args.concurrency,
+        "base_url": args.steam_url,
+        "limiter": RateLimiter(rate=0) if args.replay else RateLimiter(rate=args.rate, burst=args.burst),
+        "checkpoint": not args.no_checkpoint,
+        "resume": args.resume,
+        "base_cache": None if args.no_base_cache or args.record or args.replay or args.steam_url else BaseUrlCache(),
+        "batch_size": args.batch_size,
+        "adaptive_batch": args.adaptive_batch,
+        "max_batch_size": args.max_batch_size,
+        "retry": RetryPolicy(attempts=args.retries),
+        "parser": args.html_parser,
+        "parse_workers": args.parse_workers,
+        "fast_path": not args.no_fast_path,
+        "archive": PageArchive(args.archive) if args.archive else None,
+        "parse_cache": (
+            None if args.no_parse_cache or args.record or args.replay
+            else ParseCache(max_bytes=int(args.parse_cache_size * 1024 * 1024))
+        ),
+    }
+
+    session = None
+    if args.record:
+        session = CassetteSession(
+            args.record,
+            mode="record",
+            session=create_session(max(10, args.concurrency * len(QUASARPLAY_CURATORS))),
+            latency=args.latency,
+        )
+    elif args.replay:
+        session = CassetteSession(args.replay, mode="replay", latency=args.latency)
+
     if args.quasarplay:
-        run_quasarplay_dump(sort=args.sort)
+        if not run_quasarplay_dump(
+            sort=args.sort,
+            use_async=args.use_async,
+            incremental=args.incremental,
+            session=session,
+            **dumper_options,
+        ):
+            sys.exit(1)
         return
 
     if not args.curator:
@@ -412,45 +2683,60 @@ def main():
         print(f"오류: 유효하지 않은 큐레이터 ID 또는 URL: {args.curator}")
         sys.exit(1)
 
-    if args.output:
-        output_file = args.output
-    else:
-        ext = "txt" if args.format in ["txt", "appids"] else args.format
-        output_file = f"curator_{curator_id}_reviews.{ext}"
+    try:
+        sinks = parse_sinks(args.format, curator_id, args.output)
+    except ValueError as e:
+        parser.error(str(e))
+
+    json_sinks = [path for fmt, path in sinks if fmt == "json"]
+    if args.incremental and not json_sinks:
+        parser.error("--incremental 옵션은 json 출력이 있어야 사용할 수 있습니다.")
+    previous = load_previous_reviews(json_sinks[0]) if args.incremental else None
 
     print("=" * 60)
     print("Steam 큐레이터 리뷰 덤프 도구")
     print("=" * 60)
     print(f"큐레이터 ID: {curator_id}")
-    print(f"출력 형식: {args.format}")
-    print(f"출력 파일: {output_file}")
+    for fmt, path in sinks:
+        print(f"출력: {fmt} -> {path}")
     print()
 
-    dumper = SteamCuratorDumper(curator_id, verbose=not args.quiet, sort=args.sort)
-    info = dumper.get_curator_info()
-    if info.get("curator_name"):
-        print(f"큐레이터: {info['curator_name']}")
-    if info.get("followers") is not None:
-        print(f"팔로워: {info.get('followers', 0):,}명")
-    print()
+    def print_info(info: dict):
+        if info.get("curator_name"):
+            print(f"큐레이터: {info['curator_name']}")
+        if info.get("followers") is not None:
+            print(f"팔로워: {info.get('followers', 0):,}명")
+        print()
 
-    reviews = dumper.fetch_reviews()
-    if not reviews:
-        print("리뷰를 가져오지 못했습니다.")
+    dumper_cls = AsyncSteamCuratorDumper if args.use_async else SteamCuratorDumper
+    fields = None if previous is not None else sink_fields(sinks)
+    dumper = dumper_cls(
+        curator_id,
+        verbose=not args.quiet,
+        sort=args.sort,
+        session=session,
+        fields=fields,
+        **dumper_options,
+    )
+    if previous is not None:
+        if args.use_async:
+            reviews = asyncio.run(_dump_async(dumper, print_info, previous))
+        else:
+            print_info(dumper.get_curator_info())
+            reviews = dumper.fetch_incremental(previous)
+        total = dumper.export(reviews, sinks)
+    elif args.use_async:
+        total = asyncio.run(_export_async(dumper, sinks, print_info))
+    else:
+        print_info(dumper.get_curator_info())
+        total = dumper.export(dumper.iter_reviews(), sinks)
+    if not total:
+        print("일부 구간을 가져오지 못해 저장하지 않았습니다." if dumper.failed_windows else "리뷰를 가져오지 못했습니다.")
         sys.exit(1)
 
-    if args.format == "json":
-        dumper.export_json(reviews, output_file)
-    elif args.format == "csv":
-        dumper.export_csv(reviews, output_file)
-    elif args.format == "txt":
-        dumper.export_txt(reviews, output_file)
-    elif args.format == "appids":
-        dumper.export_appids(reviews, output_file)
-
     print()
     print("=" * 60)
-    print(f"완료! 총 {len(reviews)}개의 게임 정보가 저장되었습니다.")
+    print(f"완료! 총 {total}개의 게임 정보가 저장되었습니다.")
     print("=" * 60)
 
 if __name__ == "__main__":
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+import argparse
+import html
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+REVIEW_WORDS = ["한국어", "공식", "자막", "음성", "패치", "번역", "지원", "메뉴", "UI", "인터페이스", "일부", "완역", "유저", "한글화", "DLC", "포함"]
+RECOMMENDATION_TYPES = [("", 70), (" not_recommended", 10), (" informational", 20)]
+CURATOR_PAGE_RE = re.compile(r"^/curator/(\d+)(?:-[^/]*)?/?$")
+FILTERED_RE = re.compile(r"^/curator/(\d+)(?:-[^/]*)?/ajaxgetfilteredrecommendations/?$")
+
+class MockCatalogue:
+    def __init__(self, total: int, seed: int = 0, url_rate: float = 0.3):
+        self.total = max(0, int(total))
+        self.seed = int(seed)
+        self.url_rate = float(url_rate)
+
+    def appid(self, index: int) -> int:
+        return 10 + (self.total - index) * 10
+
+    def recommendation_html(self, curator_id: int, index: int) -> str:
+        rng = random.Random(self.seed * 1000003 + curator_id * 7919 + index)
+        appid = self.appid(index)
+        rec_class = rng.choices([c for c, _ in RECOMMENDATION_TYPES], weights=[w for _, w in RECOMMENDATION_TYPES])[0]
+        review = " ".join(rng.choice(REVIEW_WORDS) for _ in range(rng.randint(3, 24)))
+        if rng.random() < self.url_rate:
+            review += f"\n링크: https://example.com/patch/{appid}"
+        date = time.strftime("%d %B, %Y", time.gmtime(1700000000 - index * 3600))
+        return (
+            f'<div class="recommendation{rec_class}">'
+            f'<div class="capsule smallcapsule">'
+            f'<a href="https://store.steampowered.com/app/{appid}/Mock_Game_{appid}/?curator_clanid={curator_id}"'
+            f' data-ds-appid="{appid}"><img src="https://example.com/{appid}.jpg"></a></div>'
+            f'<div class="recommendation_desc">{html.escape(review)}</div>'
+            f'<div class="recommendation_readmore">'
+            f'<a href="https://store.steampowered.com/app/{appid}/?curator_clanid={curator_id}">Read More</a></div>'
+            f'<div class="curator_review_date">{date}</div>'
+            f'</div>'
+        )
+
+    def results_html(self, curator_id: int, start: int, count: int) -> str:
+        end = min(self.total, start + count)
+        return "".join(self.recommendation_html(curator_id, i) for i in range(max(0, start), end))
+
+class MockStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts = {"pages": 0, "filtered": 0, "errors": 0, "rate_limited": 0, "not_found": 0}
+
+    def add(self, key: str):
+        with self._lock:
+            self.counts[key] += 1
+
+    def summary(self) -> str:
+        with self._lock:
+            return ", ".join(f"{k}={v}" for k, v in self.counts.items())
+
+class MockCuratorHandler(BaseHTTPRequestHandler):
+    server_version = "SteamCuratorMock/1.0"
+
+    def log_message(self, format, *args):
+        if self.server.options.verbose:
+            super().log_message(format, *args)
+
+    def _send(
+        self,
+        status: int,
+        body: bytes = b"",
+        content_type: str = "text/html; charset=utf-8",
+        headers: dict = None,
+    ):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _delay(self):
+        options = self.server.options
+        delay = options.latency + random.uniform(0, options.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _inject_failure(self) -> bool:
+        options = self.server.options
+        roll = random.random()
+        if roll < options.rate_limit:
+            self.server.stats.add("rate_limited")
+            self._send(429, b"Too Many Requests", headers={"Retry-After": str(options.retry_after)})
+            return True
+        if roll < options.rate_limit + options.error_rate:
+            self.server.stats.add("errors")
+            self._send(random.choice([500, 502, 503]), b"Server Error")
+            return True
+        return False
+
+    def _curator_page(self, curator_id: int):
+        self.server.stats.add("pages")
+        host = self.headers.get("Host") or f"{self.server.server_address[0]}:{self.server.server_address[1]}"
+        base = f"http://{host}/curator/{curator_id}-Mock-Curator/"
+        escaped = base.replace("/", "\\/")
+        body = (
+            "<html><head>"
+            f'<link rel="canonical" href="{base}">'
+            "</head><body>"
+            f'<h1 class="curator_name">Mock Curator {curator_id}</h1>'
+            f'<div class="num_followers">{self.server.options.followers:,}</div>'
+            f'<script>g_strCuratorBaseURL = "{escaped}";</script>'
+            "</body></html>"
+        )
+        self._send(200, body.encode("utf-8"))
+
+    def _filtered(self, curator_id: int, query: dict):
+        self.server.stats.add("filtered")
+        options = self.server.options
+        try:
+            start = int(query.get("start", ["0"])[0])
+            count = int(query.get("count", ["50"])[0])
+        except ValueError:
+            self._send(200, json.dumps({"success": 2}).encode("utf-8"), "application/json")
+            return
+        count = min(count, options.max_count)
+        data = {
+            "success": 1,
+            "pagesize": count,
+            "total_count": self.server.catalogue.total,
+            "start": start,
+            "results_html": self.server.catalogue.results_html(curator_id, start, count),
+        }
+        self._send(200, json.dumps(data).encode("utf-8"), "application/json; charset=utf-8")
+
+    def do_GET(self):
+        self._delay()
+        parsed = urlparse(self.path)
+        m = FILTERED_RE.match(parsed.path)
+        if m:
+            if not self._inject_failure():
+                self._filtered(int(m.group(1)), parse_qs(parsed.query))
+            return
+        m = CURATOR_PAGE_RE.match(parsed.path)
+        if m:
+            if not self._inject_failure():
+                self._curator_page(int(m.group(1)))
+            return
+        self.server.stats.add("not_found")
+        self._send(404, b"Not Found")
+
+def create_server(host: str, port: int, options: argparse.Namespace) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer((host, port), MockCuratorHandler)
+    server.daemon_threads = True
+    server.options = options
+    server.catalogue = MockCatalogue(options.total, seed=options.seed, url_rate=options.url_rate)
+    server.stats = MockStats()
+    return server
+
+def main():
+    parser = argparse.ArgumentParser(description="Steam 큐레이터 로컬 테스트 서버 (부하 테스트용)")
+    parser.add_argument("--host", default="127.0.0.1", help="바인드 주소 (기본: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="포트 (기본: 8765)")
+    parser.add_argument("--total", type=int, default=10000, help="큐레이터당 추천 수 (기본: 10000)")
+    parser.add_argument("--seed", type=int, default=0, help="합성 데이터 시드")
+    parser.add_argument("--max-count", type=int, default=100, help="요청당 최대 반환 수, 초과 요청은 잘림 (기본: 100)")
+    parser.add_argument("--latency", type=float, default=0.0, help="요청당 고정 지연 시간(초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="요청당 추가 무작위 지연 상한(초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="5xx 응답 비율 (0~1)")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="429 응답 비율 (0~1)")
+    parser.add_argument("--retry-after", type=int, default=1, help="429 응답의 Retry-After 값(초)")
+    parser.add_argument("--url-rate", type=float, default=0.3, help="리뷰에 링크를 포함할 비율 (0~1)")
+    parser.add_argument("--followers", type=int, default=12345, help="큐레이터 페이지 팔로워 수")
+    parser.add_argument("-v", "--verbose", action="store_true", help="요청 로그 출력")
+    args = parser.parse_args()
+
+    server = create_server(args.host, args.port, args)
+    print(f"Steam 큐레이터 테스트 서버: http://{args.host}:{args.port}/curator (추천 {args.total:,}개)")
+    print(f"사용 예: python scrapers/steam_curator_dump.py 1 --steam-url http://{args.host}:{args.port}/curator")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"\n요청 통계: {server.stats.summary()}")
+
+if __name__ == "__main__":
+    main()
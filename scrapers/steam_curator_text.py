@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import re
+import sys
+import timeit
+from pathlib import Path
+
+URL_RE = re.compile(r'https?://[^\s"\'<>]+')
+LINK_LABEL_RE = re.compile(r"링크\s*:")
+NEWLINES_RE = re.compile(r"\n+")
+TRAILING_RE = re.compile(r"[,\\s]+$")
+
+DATE_PATTERNS = (
+    re.compile(
+        r"^\d{1,2}\s+"
+        r"(January|February|March|April|May|June|July|August|September|October|November|December)"
+        r"(,\s*\d{4})?$"
+    ),
+    re.compile(r"^\d{4}-\d{2}-\d{2}$"),
+    re.compile(r"^\d{4}\.\d{1,2}\.\d{1,2}\.?$"),
+    re.compile(r"^\d{4}년\s*\d{1,2}월\s*\d{1,2}일$"),
+)
+DATE_MAX_LENGTH = 32
+
+def sanitize_review_text(text: str):
+    if not text:
+        return "", False, 0
+    cleaned, url_count = URL_RE.subn("", text)
+    cleaned = LINK_LABEL_RE.sub("", cleaned)
+    cleaned = NEWLINES_RE.sub("\n", cleaned).strip()
+    cleaned = TRAILING_RE.sub("", cleaned)
+    return cleaned, url_count > 0, url_count
+
+def is_date_like(text: str) -> bool:
+    t = (text or "").strip()
+    if not t or len(t) > DATE_MAX_LENGTH:
+        return False
+    return any(p.match(t) for p in DATE_PATTERNS)
+
+def best_review_text(candidates: list) -> str:
+    best = ""
+    for txt in candidates:
+        if len(txt) > len(best) and not is_date_like(txt):
+            best = txt
+    return best
+
+def normalize_review_candidates(candidate_lists: list) -> list:
+    return [sanitize_review_text(best_review_text(candidates)) for candidates in candidate_lists]
+
+def _load_corpus(directory) -> list:
+    texts = []
+    for path in sorted(Path(directory).glob("*.json")):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            html = json.loads(entry["body"]).get("results_html") or ""
+        except (OSError, ValueError, KeyError, AttributeError):
+            continue
+        texts.extend(m.group(1) for m in re.finditer(r'class="recommendation_desc"[^>]*>(.*?)</div>', html, re.S))
+    return texts
+
+def _synthetic_corpus(n: int) -> list:
+    samples = [
+        "공식 한국어 지원\n링크: https://example.com/patch/1",
+        "유저 한글패치 존재, 자막만 번역됨\n\nhttps://cafe.naver.com/x/123 https://example.com/y",
+        "한국어 음성 및 자막 완역,",
+        "12 March, 2024",
+        "2024-01-02",
+    ]
+    return [samples[i % len(samples)] for i in range(n)]
+
+def run_benchmark(texts: list, repeat: int = 5) -> dict:
+    n = len(texts)
+    candidate_lists = [[t, "12 March, 2024"] for t in texts]
+    results = {}
+    for name, fn in (
+        ("sanitize_review_text", lambda: [sanitize_review_text(t) for t in texts]),
+        ("is_date_like", lambda: [is_date_like(t) for t in texts]),
+        ("normalize_review_candidates", lambda: normalize_review_candidates(candidate_lists)),
+    ):
+        best = min(timeit.repeat(fn, number=1, repeat=repeat))
+        results[name] = best / n * 1e6
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="리뷰 텍스트 정규화 마이크로 벤치마크")
+    parser.add_argument("--corpus", metavar="DIR", help="cassette 디렉터리의 리뷰 텍스트로 측정 (없으면 합성 데이터)")
+    parser.add_argument("-n", type=int, default=20000, help="합성 리뷰 수 (기본: 20000)")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (기본: 5, 최솟값 사용)")
+    args = parser.parse_args()
+
+    texts = _load_corpus(args.corpus) if args.corpus else _synthetic_corpus(args.n)
+    if not texts:
+        print("측정할 리뷰 텍스트가 없습니다.")
+        sys.exit(1)
+    print(f"리뷰 {len(texts):,}개")
+    for name, per_review in run_benchmark(texts, args.repeat).items():
+        print(f"  {name}: {per_review:.2f} µs/리뷰")
+
+if __name__ == "__main__":
+    main()